@@ -1,10 +1,20 @@
+import array
+import bisect
 import json
 import logging
+import math
+import queue
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Dict, List, Optional, Protocol, TypeVar
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Protocol, Tuple, TypeVar
 
+import numpy as np
 import utils
 from dotenv import load_dotenv
 from envs import env
@@ -20,6 +30,20 @@ load_dotenv()
 TOBACCO_NICOTINE_THRESHOLD = 0.7
 TOBACCO_NH3_LOW_THRESHOLD = 15
 TOBACCO_NH3_MEDIUM_THRESHOLD = 40
+# NH3 <= LOW is level 1, LOW < NH3 < MEDIUM is level 2 and NH3 >= MEDIUM is level 3.
+# The low edge is nudged up one ulp so a single right-sided search honours both
+# the inclusive and the exclusive boundary.
+_TOBACCO_NH3_BINS = array.array('d', (
+    math.nextafter(TOBACCO_NH3_LOW_THRESHOLD, math.inf),
+    TOBACCO_NH3_MEDIUM_THRESHOLD
+))
+EVENT_HISTORY_SIZE = 1024
+EVENT_QUEUE_SIZE = 512
+EVENT_WRITE_BATCH_SIZE = 32
+EVENT_WRITE_BATCH_TIMEOUT = 0.1
+EVENT_INTERVAL_HISTORY_SIZE = 256
+EVENT_INTERVAL_BINS = 16
+EVENT_POLL_MAX_FACTOR = 8
 
 class EventError(Exception):
     """
@@ -89,6 +113,9 @@ class EventState(Enum):
     ALERT = "alert"
     CRITICAL = "critical"
 
+# Avoids the by-value scan of EventState(name) in the detection loops
+_STATE_BY_NAME: Dict[str, EventState] = {state.value: state for state in EventState}
+
 @dataclass
 class EventData:
     """
@@ -109,8 +136,9 @@ class EventData:
         The measured value associated with the event
     timestamp : datetime
         When the event was detected
-    metadata : Dict[str, float]
-        Additional environmental data (temperature, humidity)
+    metadata : Mapping[str, float]
+        Additional environmental data (temperature, humidity), shared
+        read-only between events of the same detection cycle
     priority : int
         Priority level of the event (default: 0)
     description : str
@@ -121,7 +149,7 @@ class EventData:
     state: EventState
     value: float
     timestamp: datetime
-    metadata: Dict[str, float]
+    metadata: Mapping[str, float]
     priority: int = field(default=0)
     description: str = field(default="")
 
@@ -211,6 +239,37 @@ class AnalyteConfig:
         if self.priority < 0:
             raise ConfigurationError("priority must be non-negative")
 
+        # Sorted copy of the thresholds used to bucketize results in one search
+        self._bisect_keys = array.array('d', sorted(self.thresholds))
+
+class _LazyAnalyteConfigMap:
+    """
+    Read-only mapping that builds AnalyteConfig objects on first access.
+    
+    Only analytes that are actually looked up during detection pay for
+    construction and validation; the result is cached for later lookups.
+    
+    Parameters
+    ----------
+    raw_config : Dict[str, Dict[str, Any]]
+        The analyte_config section of the configuration file
+    """
+    def __init__(self, raw_config: Dict[str, Dict[str, Any]]):
+        self._raw_config = raw_config
+        self._cache: Dict[str, AnalyteConfig] = {}
+
+    def __getitem__(self, name: str) -> AnalyteConfig:
+        analyte_config = self._cache.get(name)
+        if analyte_config is None:
+            analyte_config = self._cache[name] = AnalyteConfig(**self._raw_config[name])
+        return analyte_config
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw_config
+
+    def get(self, name: str, default: Optional[AnalyteConfig] = None) -> Optional[AnalyteConfig]:
+        return self[name] if name in self._raw_config else default
+
 class EventObserver(Protocol):
     """
     Protocol defining the interface for event observers.
@@ -254,14 +313,45 @@ class EventEngine:
         List of supported analyte names
     _event_config : EventConfig
         Configuration for event detection
-    _analyte_config : Dict[str, AnalyteConfig]
-        Configuration for each analyte
+    _state_id : Dict[str, int]
+        Mapping of state names to their IDs
+    _state_name : List[str]
+        State names indexed by state ID
+    _analyte_config : _LazyAnalyteConfigMap
+        Configuration for each analyte, built on first lookup
     _database : MiDatabase
         Database instance for storing and retrieving data
     _metadata : Dict[str, float]
         Current environmental metadata (temperature, humidity)
-    _event_history : List[EventData]
-        History of detected events
+    _metadata_snapshot : Mapping[str, float]
+        Read-only copy of the metadata taken at the start of a detection cycle
+    _event_history : Deque[EventData]
+        Bounded history of detected events, oldest first
+    _event_history_by_type : Dict[EventType, Deque[EventData]]
+        Bounded history of detected events for each event type, oldest first
+    _last_states : Dict[str, str]
+        Most recent state detected for each event name
+    _last_change : Optional[float]
+        time.monotonic() reading of the detection cycle with the most recent
+        state change
+    _change_intervals : Deque[float]
+        Rolling window of seconds between consecutive state changes, used
+        to place the next poll
+    _last_pred_rowid : Dict[str, int]
+        Latest prediction ID already evaluated for each analyte
+    _last_detection : Optional[float]
+        time.monotonic() reading of the last completed detection cycle
+    _cycle_time : float
+        time.monotonic() reading taken at the start of the current detection cycle
+    _has_predictions : bool
+        Whether any prediction has been stored yet; detection is skipped until then
+    _tick : threading.Event
+        Set when a new prediction has been stored and detection should run
+    _stop : threading.Event
+        Set to end the run loop
+    _write_q : queue.Queue
+        Bounded queue of (event, update row) pairs waiting to be persisted
+        and dispatched to observers by the writer thread
     """
     
     def __init__(self, database: MiDatabase, metadata: Dict[str, float]):
@@ -281,21 +371,185 @@ class EventEngine:
             If initialization fails due to configuration issues
         """
         self._observers: List[EventObserver] = []
-        self._event_history: List[EventData] = []
+        self._event_history: Deque[EventData] = deque(maxlen=EVENT_HISTORY_SIZE)
+        self._event_history_by_type: Dict[EventType, Deque[EventData]] = {
+            event_type: deque(maxlen=EVENT_HISTORY_SIZE) for event_type in EventType
+        }
         self._metadata = metadata
+        self._metadata_snapshot: Mapping[str, float] = MappingProxyType(dict(metadata))
+        self._last_states: Dict[str, str] = {}
+        self._last_change: Optional[float] = None
+        self._change_intervals: Deque[float] = deque(maxlen=EVENT_INTERVAL_HISTORY_SIZE)
+        self._last_pred_rowid: Dict[str, int] = {}
+        self._last_detection: Optional[float] = None
+        self._cycle_time = time.monotonic()
+        self._tick = threading.Event()
+        self._stop = threading.Event()
         
         try:
             config = utils.load_config()
             self._supported_analytes = config['supported_analytes']
             self._event_config = EventConfig(**config['event_config'])
-            self._analyte_config = {
-                name: AnalyteConfig(**cfg) 
-                for name, cfg in config['analyte_config'].items()
+            self._state_id = {
+                state: state_id
+                for state_id, state in enumerate(self._event_config.supported_states)
             }
+            self._state_name = self._event_config.supported_states
+            self._analyte_config = _LazyAnalyteConfigMap(config['analyte_config'])
             self._database = database
         except Exception as e:
             raise ConfigurationError(f"Failed to initialize EventEngine: {str(e)}")
 
+        self._has_predictions = self._database.get_last_prediction_time() is not None
+
+        self._write_q: "queue.Queue[Optional[Tuple[EventData, Dict[str, Any]]]]" = queue.Queue(
+            maxsize=EVENT_QUEUE_SIZE
+        )
+        self._writer = threading.Thread(target=self._drain, name="event-writer", daemon=True)
+        self._writer.start()
+
+    def _queue_event(self, event: EventData, update_row: Dict[str, Any]) -> None:
+        """
+        Record an event and hand its database update to the writer thread.
+        
+        Blocks when the queue is full so that detection cannot outrun the
+        database.
+        
+        Parameters
+        ----------
+        event : EventData
+            The detected event
+        update_row : Dict[str, Any]
+            Event update in the format expected by MiDatabase.update_events
+        """
+        self._event_history.append(event)
+        self._event_history_by_type[event.type].append(event)
+        self._record_state(event.name, update_row["state"])
+        self._write_q.put((event, update_row))
+
+    def _record_state(self, event_name: str, state: str) -> None:
+        """
+        Track state changes to build the inter-event time distribution.
+        
+        Changes are timed on the monotonic clock at the start of the current
+        detection cycle, so several changes in one cycle count once.
+        
+        Parameters
+        ----------
+        event_name : str
+            Name of the event
+        state : str
+            Newly detected state
+        """
+        previous = self._last_states.get(event_name)
+        self._last_states[event_name] = state
+        if previous is None or previous == state or self._cycle_time == self._last_change:
+            return
+        if self._last_change is not None:
+            self._change_intervals.append(self._cycle_time - self._last_change)
+        self._last_change = self._cycle_time
+
+    def _drain(self) -> None:
+        """
+        Writer thread loop.
+        
+        Collects queued events into batches of up to EVENT_WRITE_BATCH_SIZE
+        items (or whatever arrived within EVENT_WRITE_BATCH_TIMEOUT seconds),
+        persists each batch with a single database call and then notifies
+        the observers.
+        """
+        running = True
+        while running:
+            item = self._write_q.get()
+            if item is None:
+                self._write_q.task_done()
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + EVENT_WRITE_BATCH_TIMEOUT
+            while len(batch) < EVENT_WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write_q.task_done()
+                    running = False
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Tuple[EventData, Dict[str, Any]]]) -> None:
+        """
+        Persist a batch of event updates and notify observers about them.
+        
+        Parameters
+        ----------
+        batch : List[Tuple[EventData, Dict[str, Any]]]
+            Events and their database update rows
+        """
+        try:
+            self._database.update_events([update_row for _, update_row in batch])
+        except Exception as e:
+            logger.error(f"Error writing event updates: {str(e)}")
+
+        for event, _ in batch:
+            self._notify_observers(event)
+            self._write_q.task_done()
+
+    def update_metadata(self, metadata: Dict[str, float]) -> None:
+        """
+        Replace the environmental metadata attached to new events.
+        
+        Parameters
+        ----------
+        metadata : Dict[str, float]
+            Current environmental metadata (temperature, humidity)
+        """
+        self._metadata = metadata
+
+    def notify_new_prediction(self) -> None:
+        """Wake the run loop after a prediction has been stored."""
+        self._has_predictions = True
+        self._tick.set()
+
+    def run(self) -> None:
+        """
+        Run event detection until stop() is called.
+        
+        Detection is triggered by notify_new_prediction() and then runs
+        straight away. If no prediction arrives within next_poll_delay()
+        seconds the loop runs anyway as a fallback, subject to
+        event_detection_required().
+        """
+        while not self._stop.is_set():
+            triggered = self._tick.wait(timeout=self.next_poll_delay())
+            self._tick.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.run_event_engine(force=triggered)
+            except EventError as e:
+                logger.error(str(e))
+
+    def stop(self) -> None:
+        """Make run() return after the current cycle."""
+        self._stop.set()
+        self._tick.set()
+
+    def flush(self) -> None:
+        """Block until every queued event has been written and dispatched."""
+        self._write_q.join()
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        self._write_q.put(None)
+        self._writer.join()
+
     def add_observer(self, observer: T) -> None:
         """
         Add an observer to be notified of events.
@@ -362,12 +616,8 @@ class EventEngine:
         IndexError
             If state_id is out of range
         """
-        states = self._event_config.supported_states
-        if state_id < 0:
-            return states[0]
-        if state_id >= len(states):
-            return states[-1]
-        return states[state_id]
+        states = self._state_name
+        return states[min(max(state_id, 0), len(states) - 1)]
 
     def _get_state_id(self, state_name: str) -> int:
         """
@@ -385,10 +635,10 @@ class EventEngine:
             
         Raises
         ------
-        ValueError
+        KeyError
             If state_name is not found
         """
-        return self._event_config.supported_states.index(state_name)
+        return self._state_id[state_name]
 
     def _create_event(self, name: str, event_type: EventType, state: EventState,
                      value: float, timestamp: datetime) -> EventData:
@@ -413,14 +663,15 @@ class EventEngine:
         EventData
             The created event data structure
         """
+        analyte_config = self._analyte_config.get(name)
         return EventData(
             name=name,
             type=event_type,
             state=state,
             value=value,
             timestamp=timestamp,
-            metadata=self._metadata.copy(),
-            priority=self._analyte_config.get(name, AnalyteConfig([], "", "")).priority
+            metadata=self._metadata_snapshot,
+            priority=analyte_config.priority if analyte_config is not None else 0
         )
 
     def _detect_analyte_event(self, detection_time: datetime) -> None:
@@ -428,57 +679,65 @@ class EventEngine:
         Detect events based on analyte concentration changes.
         
         This method processes each supported analyte and detects if its concentration
-        has changed significantly enough to trigger an event.
+        has changed significantly enough to trigger an event. Analytes without a
+        new prediction since the previous cycle are skipped, and nothing is
+        written or notified while an analyte stays in its stored state. An
+        analyte's latest prediction only counts as seen once it has been
+        evaluated without error, so a failed cycle is retried.
         
         Parameters
         ----------
         detection_time : datetime
             The time of detection
         """
-        for event_name in self._database.get_event_names():
-            if not self._database.is_analyte_event(event_name):
-                continue
+        latest_ids = self._database.get_latest_prediction_ids()
+        dirty = [
+            analyte for analyte in self._supported_analytes
+            if analyte in latest_ids and latest_ids[analyte] != self._last_pred_rowid.get(analyte)
+        ]
+        if not dirty:
+            return
 
+        failed = set()
+        for event_name, analyte, last_state_name, result in self._database.get_analyte_event_bundle(dirty):
             try:
-                analyte = self._database.get_associated_analyte(event_name)
-                result = self._database.get_prediction_value(analyte_name=analyte)
-                
                 if result is None:
                     continue
 
-                last_state_name = self._database.get_event_state(event_name=event_name)
                 new_state_id = self._get_state_id(self._event_config.default_state)
                 
                 analyte_config = self._analyte_config[analyte]
-                for threshold in analyte_config.thresholds:
-                    if result >= threshold:
-                        new_state_id += 1
+                new_state_id += bisect.bisect_right(analyte_config._bisect_keys, result)
 
                 new_state_name = self._get_state_name(new_state_id)
-                logger.info(f"Analyte {analyte}: {result} -> State: {new_state_name}")
-                
-                self._database.update_event(
-                    event_name,
-                    state=new_state_name,
-                    value=result,
-                    date=detection_time,
-                    temp=self._metadata["temp"],
-                    humidity=self._metadata["humidity"]
-                )
+                logger.info("Analyte %s: %s -> State: %s", analyte, result, new_state_name)
+                if new_state_name == last_state_name:
+                    continue
                 
                 event = self._create_event(
                     event_name,
                     EventType.ANALYTE,
-                    EventState(new_state_name),
+                    _STATE_BY_NAME[new_state_name],
                     result,
                     detection_time
                 )
-                self._event_history.append(event)
-                self._notify_observers(event)
+                self._queue_event(event, {
+                    "event_name": event_name,
+                    "state": new_state_name,
+                    "value": result,
+                    "date": detection_time,
+                    "temp": self._metadata_snapshot["temp"],
+                    "humidity": self._metadata_snapshot["humidity"]
+                })
                 
             except Exception as e:
+                failed.add(analyte)
                 logger.error(f"Error detecting analyte event for {event_name}: {str(e)}")
 
+        self._last_pred_rowid.update(
+            {analyte: latest_ids[analyte] for analyte in dirty if analyte not in failed}
+        )
+
     def _detect_tobacco_event(self, detection_time: datetime) -> None:
         """
         Detect tobacco-related events based on nicotine and NH3 levels.
@@ -498,36 +757,28 @@ class EventEngine:
             if nicotine_result is None or nh3_result is None:
                 return
 
-            tobacco_result = 0
-            if nicotine_result >= TOBACCO_NICOTINE_THRESHOLD:
-                if nh3_result <= TOBACCO_NH3_LOW_THRESHOLD:
-                    tobacco_result = 1
-                elif nh3_result < TOBACCO_NH3_MEDIUM_THRESHOLD:
-                    tobacco_result = 2
-                else:
-                    tobacco_result = 3
+            tobacco_result = 0 if nicotine_result < TOBACCO_NICOTINE_THRESHOLD else (
+                bisect.bisect_right(_TOBACCO_NH3_BINS, nh3_result) + 1
+            )
 
             tobacco_state = self._get_state_name(tobacco_result)
-            logger.info(f"Tobacco event: {tobacco_result} -> State: {tobacco_state}")
-            
-            self._database.update_event(
-                "tobacco",
-                state=tobacco_state,
-                value=tobacco_result,
-                date=detection_time,
-                temp=self._metadata["temp"],
-                humidity=self._metadata["humidity"]
-            )
+            logger.info("Tobacco event: %s -> State: %s", tobacco_result, tobacco_state)
             
             event = self._create_event(
                 "tobacco",
                 EventType.TOBACCO,
-                EventState(tobacco_state),
+                _STATE_BY_NAME[tobacco_state],
                 tobacco_result,
                 detection_time
             )
-            self._event_history.append(event)
-            self._notify_observers(event)
+            self._queue_event(event, {
+                "event_name": "tobacco",
+                "state": tobacco_state,
+                "value": tobacco_result,
+                "date": detection_time,
+                "temp": self._metadata_snapshot["temp"],
+                "humidity": self._metadata_snapshot["humidity"]
+            })
             
         except Exception as e:
             logger.error(f"Error detecting tobacco event: {str(e)}")
@@ -536,20 +787,56 @@ class EventEngine:
         """
         Check if event detection should be performed.
         
-        This method determines if enough time has passed since the last event
-        detection to warrant a new detection cycle.
+        This method determines if at least event_delay seconds have passed
+        since the last event detection. Elapsed time is measured on the
+        monotonic clock so wall-clock adjustments cannot stall or rush
+        detection. next_poll_delay() only decides how long the run loop
+        waits, not whether a cycle is due.
         
         Returns
         -------
         bool
             True if event detection is required, False otherwise
         """
-        latest_event = self._database.get_latest_event()
-        if latest_event is None:
+        if self._last_detection is None:
             return True
-            
-        time_diff = (datetime.now() - latest_event[1]).seconds
-        return time_diff > self._event_config.event_delay
+
+        return (time.monotonic() - self._last_detection) >= float(self._event_config.event_delay)
+
+    def next_poll_delay(self) -> float:
+        """
+        Get the delay in seconds before the next event detection is due.
+        
+        Fits a histogram estimate of the inter-event time density p(t) from
+        the recorded state changes and walks the poll placement recurrence
+        L_i = L_{i-1} + F(L_{i-1}) / p(L_{i-1}), where F is the cumulative
+        distribution, until it passes the time elapsed since the last
+        change. Polls are packed tightly while a change is likely and spread
+        out during quiet periods. The result is bounded by event_delay and
+        EVENT_POLL_MAX_FACTOR times event_delay.
+        
+        Returns
+        -------
+        float
+            Seconds from now until the next poll
+        """
+        base = float(self._event_config.event_delay)
+        ceiling = base * EVENT_POLL_MAX_FACTOR
+        if self._last_change is None or len(self._change_intervals) < 2:
+            return base
+
+        density, edges = np.histogram(self._change_intervals, bins=EVENT_INTERVAL_BINS, density=True)
+        cdf = np.concatenate(([0.0], np.cumsum(density * np.diff(edges))))
+        elapsed = time.monotonic() - self._last_change
+
+        poll = base
+        while poll <= elapsed:
+            bin_id = int(np.searchsorted(edges, poll, side='right')) - 1
+            if not 0 <= bin_id < len(density) or density[bin_id] <= 0:
+                return ceiling
+            poll += max(float(np.interp(poll, edges, cdf)) / density[bin_id], base)
+
+        return min(max(poll - elapsed, base), ceiling)
 
     def get_event_history(self, event_type: Optional[EventType] = None,
                          limit: int = 100) -> List[EventData]:
@@ -566,14 +853,13 @@ class EventEngine:
         Returns
         -------
         List[EventData]
-            List of events, filtered by type if specified, sorted by timestamp
+            List of events, filtered by type if specified, newest first
         """
-        events = self._event_history
-        if event_type is not None:
-            events = [e for e in events if e.type == event_type]
-        return sorted(events, key=lambda x: x.timestamp, reverse=True)[:limit]
+        # Events are appended in detection order, so reversing yields newest first
+        history = self._event_history if event_type is None else self._event_history_by_type[event_type]
+        return list(islice(reversed(history), limit))
 
-    def run_event_engine(self) -> None:
+    def run_event_engine(self, force: bool = False) -> None:
         """
         Run the event detection engine.
         
@@ -584,21 +870,31 @@ class EventEngine:
         - Mould events
         - Virus events
         
+        Parameters
+        ----------
+        force : bool, default=False
+            Skip the event_detection_required() check, e.g. when a new
+            prediction has just been stored
+        
         Raises
         ------
         EventError
             If event detection fails
         """
-        if not self.event_detection_required():
+        if not self._has_predictions or not (force or self.event_detection_required()):
             return
 
         try:
             detection_time = datetime.now()
+            self._cycle_time = time.monotonic()
+            # One read-only copy shared by every event of this cycle
+            self._metadata_snapshot = MappingProxyType(dict(self._metadata))
             self._detect_analyte_event(detection_time)
             self._detect_tobacco_event(detection_time)
             self._detect_aqi_event()
             self._detect_mould_event()
             self._detect_virus_event()
+            self._last_detection = time.monotonic()
         except Exception as e:
             logger.error(f"Error running event engine: {str(e)}")
             raise EventError(f"Failed to run event engine: {str(e)}")
@@ -6,15 +6,17 @@ handling both telemetry and prediction data.
 
 import asyncio
 import logging
-import os
+import random
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
+import aiomqtt
 import constants as const
-from tb_device_mqtt import TBDeviceMqttClient
+import orjson
 
-from .settings import settings
+from .settings import read_command, settings
 from .models import (
+    JSON_OPTIONS,
     Assembly,
     Metadata,
     PredictionPayload,
@@ -25,19 +27,42 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+TELEMETRY_TOPIC = 'v1/devices/me/telemetry'
+MSGPACK_TELEMETRY_TOPIC = f'{TELEMETRY_TOPIC}/msgpack'
+# Reconnect backoff: min(CONNECT_MAX_BACKOFF, CONNECT_BASE_BACKOFF * 2**attempt) plus jitter
+CONNECT_BASE_BACKOFF = 0.2
+CONNECT_MAX_BACKOFF = 30.0
+# (type, unit) pairs for each telemetry value, in payload order
+_TELE_SCHEMA = tuple(zip(const.TELEMETRY_TYPES, const.TELEMETRY_UNITS))[:const.NB_OF_TELEMETRY_VALUES]
+
+
+def _encode(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes.
+
+    orjson handles datetime, UUID and numpy values natively, so payload models
+    do not need to pre-format them.
+
+    Args:
+        payload: Dictionary or list to serialize.
+
+    Returns:
+        bytes: UTF-8 encoded JSON document.
+    """
+    return orjson.dumps(payload, option=JSON_OPTIONS)
+
 
 class MQTTInterface:
-    """Async interface for MQTT communication with ThingsBoard."""
+    """Async interface for MQTT communication with ThingsBoard.
+
+    Uses an asyncio-native MQTT client, so publishing is awaited directly on
+    the event loop without handing work to a thread pool. The device token
+    is the MQTT username, as ThingsBoard expects.
+    """
 
     def __init__(self):
         """Initialize the MQTT interface."""
-        self._client = TBDeviceMqttClient(
-            host=settings.thingsboard.host,
-            port=settings.thingsboard.port,
-            token=settings.thingsboard.device_token
-        )
+        self._client: Optional[aiomqtt.Client] = None
         self._connected = False
-        self._lock = asyncio.Lock()
 
     async def connect(self) -> bool:
         """Connect to ThingsBoard MQTT broker.
@@ -45,13 +70,18 @@ class MQTTInterface:
         Returns:
             bool: True if connection was successful, False otherwise.
         """
+        # Release a client whose connection dropped underneath us
+        await self.disconnect()
+        client = aiomqtt.Client(
+            hostname=settings.thingsboard.host,
+            port=settings.thingsboard.port,
+            username=settings.thingsboard.device_token,
+            keepalive=settings.thingsboard.keepalive,
+            timeout=settings.thingsboard.connection_timeout
+        )
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._client.connect,
-                settings.thingsboard.connection_timeout,
-                settings.thingsboard.keepalive
-            )
+            await client.__aenter__()
+            self._client = client
             self._connected = True
             logger.info("Successfully connected to ThingsBoard MQTT broker")
             return True
@@ -62,56 +92,66 @@ class MQTTInterface:
 
     async def disconnect(self) -> None:
         """Disconnect from ThingsBoard MQTT broker."""
-        if not self._connected:
+        if self._client is None:
             return
 
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._client.disconnect
-            )
-            self._connected = False
+            await self._client.__aexit__(None, None, None)
             logger.info("Successfully disconnected from ThingsBoard MQTT broker")
         except Exception as e:
             logger.error(f"Error disconnecting from ThingsBoard: {str(e)}")
+        finally:
+            self._client = None
+            self._connected = False
 
     @property
     def is_connected(self) -> bool:
         """Check if connected to ThingsBoard.
 
+        A dropped connection is noticed through the MqttError raised by the
+        next publish, which clears the flag.
+
         Returns:
             bool: True if connected, False otherwise.
         """
-        return self._connected and self._client.is_connected()
+        return self._connected
 
-    async def send_telemetry(self, payload: Dict[str, Any]) -> Optional[Dict]:
+    async def send_telemetry(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
         """Send telemetry data to ThingsBoard.
 
         Args:
-            payload: The telemetry data to send.
+            payload: The telemetry data to send, encoded with orjson.
 
         Returns:
-            Optional[Dict]: Response from ThingsBoard if successful, None otherwise.
+            bool: True if the payload was published, False otherwise.
+        """
+        return await self.send_raw(TELEMETRY_TOPIC, _encode(payload))
+
+    async def send_raw(self, topic: str, data: bytes, qos: int = 0) -> bool:
+        """Publish an already encoded payload.
+
+        Args:
+            topic: MQTT topic to publish on.
+            data: Encoded payload bytes.
+            qos: MQTT quality of service level.
+
+        Returns:
+            bool: True if the payload was published, False otherwise.
         """
         if not self.is_connected:
             logger.error("Not connected to ThingsBoard")
-            return None
+            return False
 
-        async with self._lock:
-            try:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self._client.send_telemetry,
-                    payload,
-                    0  # QoS level
-                )
-                return await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    result.get
-                )
-            except Exception as e:
-                logger.error(f"Failed to send telemetry: {str(e)}")
-                return None
+        try:
+            await self._client.publish(topic, data, qos=qos)
+            return True
+        except aiomqtt.MqttError as e:
+            logger.error(f"Failed to send telemetry: {str(e)}")
+            self._connected = False
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send telemetry: {str(e)}")
+            return False
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -129,9 +169,25 @@ class ThingsBoardClient:
     def __init__(self):
         """Initialize the ThingsBoard client."""
         self._mqtt = MQTTInterface()
-        self._connected = False
         # Number of connection attempts
         self._max_connection_attempts = const.NB_OF_THINGSBOARD_CONNECT_ATTEMPTS
+        # SBC and LCD assemblies never change at runtime, so build them once
+        self._sbc_assembly: Assembly = {
+            'type': settings.components.sbc_type,
+            'sn': self._read_sbc_serial_number(),
+            'manufacturer': settings.components.sbc_manufacturer,
+            'hv': settings.components.sbc_hardware_version,
+            'fv': None
+        }
+        self._lcd_assembly: Assembly = {
+            'type': settings.components.lcd_type,
+            'sn': None,
+            'manufacturer': settings.components.lcd_manufacturer,
+            'hv': None,
+            'fv': None
+        }
+        # Scratch buffer reused by every JSON prediction batch
+        self._prediction_buffer = bytearray()
 
     @property
     def is_connected(self) -> bool:
@@ -140,7 +196,7 @@ class ThingsBoardClient:
         Returns:
             bool: True if connected, False otherwise.
         """
-        return self._connected and self._mqtt.is_connected
+        return self._mqtt.is_connected
 
     async def connect(self) -> bool:
         """Connect to ThingsBoard.
@@ -148,7 +204,7 @@ class ThingsBoardClient:
         Returns:
             bool: True if connection was successful, False otherwise.
         """
-        if self._connected:
+        if self._mqtt.is_connected:
             return True
 
         # First check if WiFi is connected
@@ -159,71 +215,77 @@ class ThingsBoardClient:
         # Try connecting multiple times
         for attempt in range(self._max_connection_attempts):
             logger.info(f"Connection attempt {attempt + 1}/{self._max_connection_attempts}")
-            self._connected = await self._mqtt.connect()
-            if self._connected:
+            if await self._mqtt.connect():
                 logger.info("Successfully connected to ThingsBoard")
                 return True
-            await asyncio.sleep(1)  # Wait before retrying
+            # Re-check the link once retries start piling up
+            if attempt == 2 and not settings.connection.test_wifi_connection():
+                logger.error("WiFi connection lost")
+                return False
+            # Exponential backoff with jitter so gateways don't reconnect in lockstep
+            await asyncio.sleep(
+                min(CONNECT_MAX_BACKOFF, CONNECT_BASE_BACKOFF * 2 ** attempt)
+                + random.random() * CONNECT_BASE_BACKOFF
+            )
 
         logger.error(f"Failed to connect after {self._max_connection_attempts} attempts")
         return False
 
     async def disconnect(self) -> None:
         """Disconnect from ThingsBoard."""
-        if not self._connected:
-            return
-
         await self._mqtt.disconnect()
-        self._connected = False
+
+    @staticmethod
+    def _read_sbc_serial_number() -> Optional[str]:
+        """Read the SBC serial number.
+
+        Returns:
+            Optional[str]: The serial number or None if it cannot be read.
+        """
+        try:
+            return read_command(settings.components.sbc_serial_number_location).decode().rstrip('\x00')
+        except Exception as e:
+            logger.error(f"Failed to read SBC serial number: {str(e)}")
+            return None
 
     def _create_assemblies(self, bfu_device_id: str) -> List[Assembly]:
-        """Create assembly objects for device components.
+        """Create assembly entries for device components.
+
+        Only the BFU assembly depends on the payload; the SBC and LCD
+        assemblies are shared.
 
         Args:
             bfu_device_id: The BFU device ID.
 
         Returns:
-            List[Assembly]: List of assembly objects.
+            List[Assembly]: List of assembly entries.
         """
         assemblies = [
-            Assembly(
-                type=settings.components.sbc_type,
-                manufacturer=settings.components.sbc_manufacturer,
-                serial_number=os.popen(settings.components.sbc_serial_number_location).read().rstrip('\x00'),
-                hardware_version=settings.components.sbc_hardware_version
-            ),
-            Assembly(
-                type=settings.components.bfu_type,
-                manufacturer=settings.components.bfu_manufacturer,
-                serial_number=bfu_device_id,
-                hardware_version=settings.components.bfu_hardware_version,
-                firmware_version=settings.components.bfu_firmware_version
-            ),
-            Assembly(
-                type=settings.components.lcd_type,
-                manufacturer=settings.components.lcd_manufacturer
-            )
+            self._sbc_assembly,
+            {
+                'type': settings.components.bfu_type,
+                'sn': bfu_device_id,
+                'manufacturer': settings.components.bfu_manufacturer,
+                'hv': settings.components.bfu_hardware_version,
+                'fv': settings.components.bfu_firmware_version
+            },
+            self._lcd_assembly
         ]
         return assemblies
 
     def _create_telemetry_objects(self, telemetry_data: List[Union[int, float, str, bool]]) -> List[Telemetry]:
-        """Create telemetry objects from data values.
+        """Create telemetry entries from data values.
 
         Args:
             telemetry_data: List of telemetry values.
 
         Returns:
-            List[Telemetry]: List of telemetry objects.
+            List[Telemetry]: List of telemetry entries.
         """
-        telemetry_list = []
-        for i in range(min(const.NB_OF_TELEMETRY_VALUES, len(telemetry_data))):
-            telemetry = Telemetry(
-                type=const.TELEMETRY_TYPE_AND_UNIT[i]["type"],
-                value=telemetry_data[i],
-                unit=const.TELEMETRY_TYPE_AND_UNIT[i]["unit"]
-            )
-            telemetry_list.append(telemetry)
-        return telemetry_list
+        return [
+            {'type': telemetry_type, 'value': value, 'unit': unit}
+            for (telemetry_type, unit), value in zip(_TELE_SCHEMA, telemetry_data)
+        ]
 
     async def send_telemetry(self, payload: List[Any]) -> bool:
         """Send telemetry data to ThingsBoard.
@@ -232,8 +294,8 @@ class ThingsBoardClient:
             payload: The complete payload list containing telemetry values and metadata.
                 The payload must include telemetry values followed by BFU device ID and timestamp:
                 - payload[0:NB_OF_TELEMETRY_VALUES-1]: Telemetry values
-                - payload[BFU_DEVICE_ID_INDEX]: BFU device ID
-                - payload[CREATED_AT_INDEX]: Created timestamp
+                - payload[BFU_DEVICE_ID_INDEX-1]: BFU device ID
+                - payload[CREATED_AT_INDEX-1]: Created timestamp
 
         Returns:
             bool: True if data was sent successfully, False otherwise.
@@ -243,20 +305,20 @@ class ThingsBoardClient:
             ConnectionError: If there's an issue with the network connection.
             ValueError: If the telemetry data format is invalid.
         """
-        if not self._connected:
+        if not self.is_connected:
             logger.error("Not connected to ThingsBoard")
             return False
 
         try:
             # Extract metadata from payload as per original implementation
-            if len(payload) <= const.CREATED_AT_INDEX:
+            if len(payload) < const.CREATED_AT_INDEX:
                 raise IndexError("Payload doesn't contain all required elements")
 
-            created_at = payload[const.CREATED_AT_INDEX]
-            bfu_device_id = payload[const.BFU_DEVICE_ID_INDEX]
+            created_at = payload[const.CREATED_AT_INDEX-1]
+            bfu_device_id = payload[const.BFU_DEVICE_ID_INDEX-1]
             telemetry_data = payload[:const.NB_OF_TELEMETRY_VALUES]
 
-            # Create telemetry objects using the constants
+            # Create telemetry entries using the constants
             telemetry = self._create_telemetry_objects(telemetry_data)
 
             # Create metadata
@@ -276,7 +338,7 @@ class ThingsBoardClient:
                 warmup_time=settings.statistics.warmup_time
             )
 
-            # Create payload - UUID is auto-generated in the model
+            # Create payload - cid is auto-generated in the model
             telemetry_payload = TelemetryPayload(
                 device_type=settings.device.type,
                 serial_number=settings.device.serial_number,
@@ -289,8 +351,7 @@ class ThingsBoardClient:
             )
 
             # Send payload
-            result = await self._mqtt.send_telemetry(telemetry_payload.to_dict())
-            return result is not None
+            return await self._mqtt.send_raw(TELEMETRY_TOPIC, telemetry_payload.encode())
 
         except Exception as e:
             logger.error(f"Failed to send telemetry: {str(e)}")
@@ -310,15 +371,16 @@ class ThingsBoardClient:
             ConnectionError: If there's an issue with the network connection.
             ValueError: If the prediction data format is invalid.
         """
-        if not self._connected:
+        if not self.is_connected:
             logger.error("Not connected to ThingsBoard")
             return False
 
         try:
-            # UUID is auto-generated in the model
+            # cid is auto-generated in the model
             payload = PredictionPayload(predictions=predictions)
-            result = await self._mqtt.send_telemetry(payload.to_dict())
-            return result is not None
+            if settings.thingsboard.prediction_encoding == 'msgpack':
+                return await self._mqtt.send_raw(MSGPACK_TELEMETRY_TOPIC, payload.to_msgpack())
+            return await self._mqtt.send_raw(TELEMETRY_TOPIC, payload.to_bytes(self._prediction_buffer))
         except Exception as e:
             logger.error(f"Failed to send predictions: {str(e)}")
             return False
@@ -1,54 +1,47 @@
 """Payload models for ThingsBoard MQTT communication.
 
 This module defines the data structures used for creating MQTT payloads
-that will be sent to ThingsBoard. The models are implemented as dataclasses
-for better type safety.
+that will be sent to ThingsBoard. The telemetry payload, metadata and
+statistics are msgspec structs whose field names match the wire format, so a
+payload is encoded to JSON in one pass; assembly and telemetry entries are
+plain TypedDicts built directly by the client. Prediction batches are dataclasses encoded
+either as JSON or as MessagePack through a msgspec schema.
 """
 
-import uuid
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, TypedDict, Union
 
+import msgspec
+import orjson
 
-@dataclass
-class Assembly:
-    """Represents a device assembly component.
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+class Assembly(TypedDict):
+    """Represents a device assembly component, in its wire format.
     
-    This class describes a physical component of the device, such as
-    the SBC (Single Board Computer), BFU, or LCD.
+    This describes a physical component of the device, such as the SBC
+    (Single Board Computer), BFU, or LCD. Assemblies are only ever
+    serialized, so they are plain dicts rather than objects.
     
     Attributes:
         type: The type/name of the component (e.g., "SBC", "BFU", "LCD").
+        sn: The serial number of the component (optional).
         manufacturer: The manufacturer of the component.
-        serial_number: The serial number of the component (optional).
-        hardware_version: The hardware version of the component (optional).
-        firmware_version: The firmware version of the component (optional).
+        hv: The hardware version of the component (optional).
+        fv: The firmware version of the component (optional).
     """
     type: str
+    sn: Optional[str]
     manufacturer: str
-    serial_number: Optional[str] = None
-    hardware_version: Optional[str] = None
-    firmware_version: Optional[str] = None
+    hv: Optional[str]
+    fv: Optional[str]
 
-    def to_dict(self) -> Dict:
-        """Convert the assembly to a dictionary format.
-        
-        Returns:
-            Dict: Dictionary representation of the assembly for JSON serialization.
-        """
-        return {
-            'type': self.type,
-            'sn': self.serial_number,
-            'manufacturer': self.manufacturer,
-            'hv': self.hardware_version,
-            'fv': self.firmware_version
-        }
-
-
-@dataclass
-class Telemetry:
-    """Represents a telemetry data point.
+
+class Telemetry(TypedDict):
+    """Represents a telemetry data point, in its wire format.
     
     Each telemetry point has a type, value and optional unit.
     
@@ -59,23 +52,10 @@ class Telemetry:
     """
     type: str
     value: Union[int, float, str, bool]
-    unit: Optional[str] = None
-
-    def to_dict(self) -> Dict:
-        """Convert the telemetry to a dictionary format.
-        
-        Returns:
-            Dict: Dictionary representation of the telemetry for JSON serialization.
-        """
-        return {
-            'type': self.type,
-            'value': self.value,
-            'unit': self.unit
-        }
+    unit: Optional[str]
 
 
-@dataclass
-class Statistics:
+class Statistics(msgspec.Struct, rename='camel'):
     """Represents device statistics.
     
     Contains operational statistics about the device.
@@ -95,24 +75,8 @@ class Statistics:
     device_status: str = "ACTIVE"
     debug: bool = False
 
-    def to_dict(self) -> Dict:
-        """Convert the statistics to a dictionary format.
-        
-        Returns:
-            Dict: Dictionary representation of the statistics for JSON serialization.
-        """
-        return {
-            'bootCount': self.boot_count,
-            'bootAt': self.boot_at,
-            'timeSinceBoot': self.time_since_boot,
-            'warmupTime': self.warmup_time,
-            'deviceStatus': self.device_status,
-            'debug': self.debug
-        }
-
-
-@dataclass
-class Metadata:
+
+class Metadata(msgspec.Struct, rename='camel'):
     """Represents device metadata.
     
     Contains metadata about the device, including version information
@@ -129,25 +93,10 @@ class Metadata:
     assembled_by: str
     assembly_version: str
     manufactured_at: str
-    assemblies: List[Assembly] = field(default_factory=list)
+    assemblies: List[Assembly] = msgspec.field(default_factory=list, name='assembly')
 
-    def to_dict(self) -> Dict:
-        """Convert the metadata to a dictionary format.
-        
-        Returns:
-            Dict: Dictionary representation of the metadata for JSON serialization.
-        """
-        return {
-            'payloadVersion': self.payload_version,
-            'assembledBy': self.assembled_by,
-            'assemblyVersion': self.assembly_version,
-            'manufacturedAt': self.manufactured_at,
-            'assembly': [assembly.to_dict() for assembly in self.assemblies]
-        }
 
-
-@dataclass
-class TelemetryPayload:
+class TelemetryPayload(msgspec.Struct, rename='camel'):
     """Main telemetry payload structure.
     
     This is the top-level container for telemetry data sent to ThingsBoard.
@@ -166,56 +115,99 @@ class TelemetryPayload:
     device_type: str
     serial_number: str
     manufacturer: str
-    hardware_version: str
+    hardware_version: str = msgspec.field(name='hv')
     created_at: datetime
     metadata: Metadata
     statistics: Statistics
-    telemetry: List[Telemetry] = field(default_factory=list)
-    cid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    telemetry: List[Telemetry] = msgspec.field(default_factory=list)
+    cid: str = msgspec.field(default_factory=lambda: secrets.token_hex(16))
 
-    def to_dict(self) -> Dict:
-        """Convert the payload to a dictionary format.
+    def encode(self) -> bytes:
+        """Encode the payload to JSON bytes.
+        
+        The document is built in a single pass of msgspec's encoder, with no
+        intermediate dicts.
         
         Returns:
-            Dict: Dictionary representation of the payload for JSON serialization.
+            bytes: JSON encoded payload.
         """
-        return {
-            'cid': self.cid,
-            'deviceType': self.device_type,
-            'serialNumber': self.serial_number,
-            'manufacturer': self.manufacturer,
-            'hv': self.hardware_version,
-            'createdAt': self.created_at.isoformat(),
-            'metadata': self.metadata.to_dict(),
-            'statistics': self.statistics.to_dict(),
-            'telemetry': [t.to_dict() for t in self.telemetry]
-        }
-
-
-@dataclass
+        return _TELEMETRY_ENCODER.encode(self)
+
+
+_TELEMETRY_ENCODER = msgspec.json.Encoder()
+
+
+class PredictionRecord(msgspec.Struct, array_like=True):
+    """A single prediction in the MessagePack wire format.
+    
+    Encoded as a positional [cid, d, p] array to keep frames small.
+    
+    Attributes:
+        cid: Identifier of the payload the prediction belongs to.
+        d: Timestamp of the prediction.
+        p: Predicted value per analyte.
+    """
+    cid: str
+    d: datetime
+    p: Dict[str, float]
+
+
+_PREDICTION_ENCODER = msgspec.msgpack.Encoder()
+
+
+@dataclass(slots=True)
 class PredictionPayload:
     """Payload structure for prediction data.
     
     Used to send prediction results to ThingsBoard.
     
     Attributes:
-        predictions: Dictionary mapping timestamps to prediction values.
+        predictions: Dictionary mapping timestamps to the predicted value of
+            each analyte.
         cid: Unique identifier for this payload (auto-generated).
     """
-    predictions: Dict[datetime, float] = field(default_factory=dict)
-    cid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    predictions: Dict[datetime, Dict[str, float]] = field(default_factory=dict)
+    cid: str = field(default_factory=lambda: secrets.token_hex(16))
 
-    def to_dict(self) -> List[Dict]:
-        """Convert the predictions to a list of dictionaries.
+    def to_bytes(self, buffer: Optional[bytearray] = None) -> bytes:
+        """Encode the predictions as a JSON array in a single pass.
+        
+        Records are encoded one at a time and appended to a byte buffer, so
+        no intermediate list of dicts is built for the batch. Timestamps are
+        formatted by orjson with second precision.
+        
+        Args:
+            buffer: Optional scratch buffer to reuse between batches; it is
+                cleared before use.
+        
+        Returns:
+            bytes: JSON encoded predictions.
+        """
+        buf = bytearray() if buffer is None else buffer
+        buf.clear()
+        append = buf.extend
+        append(b'[')
+        for timestamp, prediction in self.predictions.items():
+            if len(buf) > 1:
+                append(b',')
+            append(orjson.dumps(
+                {'cid': self.cid, 'd': timestamp, 'p': prediction},
+                option=orjson.OPT_OMIT_MICROSECONDS
+            ))
+        append(b']')
+        return bytes(buf)
+
+    def to_msgpack(self) -> bytes:
+        """Encode the predictions as a MessagePack array of PredictionRecord.
+        
+        Timestamps are made timezone-aware first, naive ones being taken as
+        local time, so msgspec writes them with the MessagePack timestamp
+        extension rather than as RFC 3339 strings.
         
         Returns:
-            List[Dict]: List of dictionaries for JSON serialization.
+            bytes: MessagePack encoded predictions.
         """
-        return [
-            {
-                'cid': self.cid,
-                'd': timestamp.strftime("%Y-%m-%dT%H:%M:%S%z"),
-                'p': prediction
-            }
+        return _PREDICTION_ENCODER.encode([
+            PredictionRecord(self.cid, timestamp.astimezone(), prediction)
             for timestamp, prediction in self.predictions.items()
-        ]
+        ])
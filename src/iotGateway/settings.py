@@ -4,7 +4,11 @@ This module provides type-safe configuration management using Pydantic models.
 All environment variables are loaded and validated here.
 """
 
-import os
+import shlex
+import subprocess
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 from pydantic import BaseSettings, Field
@@ -12,17 +16,79 @@ from pydantic import BaseSettings, Field
 # Load environment variables from .env file
 load_dotenv()
 
+# Seconds a command output stays valid; None caches for the process lifetime
+BOOT_COUNT_TTL = None
 
-class ThingsBoardSettings(BaseSettings):
+UPTIME_PATH = '/proc/uptime'
+
+
+@lru_cache(maxsize=16)
+def _run_command(command: str, bucket: int) -> bytes:
+    """Run a command without a shell and return its standard output.
+    
+    Args:
+        command: Command line, split with shell quoting rules.
+        bucket: TTL bucket the result is cached under.
+    
+    Returns:
+        bytes: Raw standard output of the command.
+    """
+    return subprocess.run(shlex.split(command), stdout=subprocess.PIPE, check=False).stdout
+
+
+def read_uptime() -> float:
+    """Read the seconds elapsed since boot from the kernel.
+    
+    Returns:
+        float: Uptime in seconds.
+    """
+    with open(UPTIME_PATH, 'rb') as uptime:
+        return float(uptime.read().split(b' ', 1)[0])
+
+
+@lru_cache(maxsize=None)
+def _boot_at() -> str:
+    """Get the boot time in the format printed by 'uptime -s'.
+    
+    Returns:
+        str: Local boot timestamp.
+    """
+    return datetime.fromtimestamp(time.time() - read_uptime()).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def read_command(command: str, ttl: Optional[float] = None) -> bytes:
+    """Read the output of a command, reusing it for ttl seconds.
+    
+    Args:
+        command: Command line to run.
+        ttl: Seconds the output stays valid, or None to cache it forever.
+    
+    Returns:
+        bytes: Raw standard output of the command.
+    """
+    bucket = 0 if ttl is None else int(time.monotonic() // ttl)
+    return _run_command(command, bucket)
+
+
+class FrozenSettings(BaseSettings):
+    """Base for settings that are validated once and never reassigned."""
+    
+    class Config:
+        allow_mutation = False
+
+
+class ThingsBoardSettings(FrozenSettings):
     """ThingsBoard connection settings."""
     host: str = Field(..., env='THINGSBOARD_HOST')
     port: int = Field(..., env='THINGSBOARD_PORT')
     device_token: str = Field(..., env='THINGSBOARD_DEVICE_TOKEN')
     connection_timeout: int = 2
     keepalive: int = 2
+    # Wire format for prediction batches: 'msgpack' or 'json'
+    prediction_encoding: str = Field(default='msgpack', env='MQTT_PREDICTION_ENCODING')
 
 
-class DeviceSettings(BaseSettings):
+class DeviceSettings(FrozenSettings):
     """Device-specific settings."""
     type: str = Field(..., env='EDGE_DEVICE_TYPE')
     serial_number: str = Field(..., env='EDGE_DEVICE_SERIAL_NUMBER')
@@ -34,7 +100,7 @@ class DeviceSettings(BaseSettings):
     manufactured_at: str = Field(..., env='DEVICE_MANUFACTURED_AT')
 
 
-class ComponentSettings(BaseSettings):
+class ComponentSettings(FrozenSettings):
     """Settings for various device components."""
     sbc_type: str = Field(..., env='SBC_TYPE')
     sbc_manufacturer: str = Field(..., env='SBC_MANUFACTURER')
@@ -50,11 +116,9 @@ class ComponentSettings(BaseSettings):
     lcd_manufacturer: str = Field(..., env='LCD_MANUFACTURER')
 
 
-class StatisticsSettings(BaseSettings):
+class StatisticsSettings(FrozenSettings):
     """Device statistics settings."""
     boot_count_location: str = Field(..., env='STAT_BOOT_COUNT')
-    boot_at_location: str = Field(..., env='STAT_BOOT_AT')
-    time_since_boot_location: str = Field(..., env='STAT_TIME_SINCE_BOOT')
     warmup_time: int = Field(..., env='STAT_WARMUP_TIME')
     
     # Read values from system and provide fallbacks
@@ -65,20 +129,21 @@ class StatisticsSettings(BaseSettings):
             int: The boot count value or 0 if unavailable.
         """
         try:
-            return int(os.popen(self.boot_count_location).read())
+            return int(read_command(self.boot_count_location, BOOT_COUNT_TTL))
         except Exception:
             return 0
     
     def get_boot_at(self) -> str:
         """Get the boot timestamp with fallback.
         
+        Derived once from the kernel uptime.
+        
         Returns:
             str: The boot timestamp or current time if unavailable.
         """
         try:
-            return str(os.popen(self.boot_at_location).read()).replace("\n", "")
+            return _boot_at()
         except Exception:
-            from datetime import datetime
             return datetime.now().isoformat()
     
     def get_time_since_boot(self) -> int:
@@ -88,31 +153,32 @@ class StatisticsSettings(BaseSettings):
             int: The time since boot in seconds or 0 if unavailable.
         """
         try:
-            import re
-            time_str = os.popen(self.time_since_boot_location).read()
-            return int(re.sub("[^0-9]", "", time_str))
+            return int(read_uptime())
         except Exception:
             return 0
 
 
-class ConnectionSettings(BaseSettings):
+class ConnectionSettings(FrozenSettings):
     """Connection settings."""
-    test_wifi_command: str = Field(default="iwconfig", env='TEST_WIFI_CONNECTION')
+    wifi_interface: str = Field(default="wlan0", env='WIFI_IFACE')
     
     def test_wifi_connection(self) -> bool:
         """Test if WiFi is connected.
         
+        Reads the kernel's operational state for the interface instead of
+        running a command.
+        
         Returns:
             bool: True if WiFi is connected, False otherwise.
         """
         try:
-            result = str(os.popen(self.test_wifi_command).read())
-            return "state UP" in result
-        except Exception:
+            with open(f'/sys/class/net/{self.wifi_interface}/operstate', 'rb') as operstate:
+                return operstate.read().strip() == b'up'
+        except OSError:
             return False
 
 
-class Settings(BaseSettings):
+class Settings(FrozenSettings):
     """Main configuration settings class."""
     thingsboard: ThingsBoardSettings = ThingsBoardSettings()
     device: DeviceSettings = DeviceSettings()
@@ -125,5 +191,15 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get the validated settings, reading the environment only once.
+    
+    Returns:
+        Settings: The shared, immutable settings instance.
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
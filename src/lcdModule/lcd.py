@@ -51,9 +51,22 @@ class EventState(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+# Backlight color per event state, indexed by EventState value - 1
+_STATE_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    LCDColor.GREEN,
+    LCDColor.YELLOW,
+    LCDColor.RED,
+    LCDColor.DARK_VIOLET,
+    LCDColor.GHOST_WHITE
+)
+
+
+@dataclass(frozen=True, eq=True)
 class DisplayData:
-    """Data structure for display information."""
+    """Data structure for display information.
+    
+    Frozen so a frame can be cached and compared with the next one.
+    """
     event_name: str
     event_state: EventState
     event_value: float
@@ -62,6 +75,10 @@ class DisplayData:
     cpu_usage: float
 
 
+# Second row template: temperature, humidity and CPU usage
+_ROW2_FMT = b"T%02d*C H%02d%% P%03d%%"
+
+
 class LCDInterface(ABC):
     """
     Abstract base class for LCD implementations.
@@ -85,6 +102,18 @@ class LCDInterface(ABC):
         """Print text to the display."""
         pass
 
+    def printout_str(self, text: str) -> None:
+        """Print a string to the display."""
+        self.printout(text)
+
+    def printout_int(self, number: int) -> None:
+        """Print a number to the display."""
+        self.printout_str(str(number))
+
+    def printout_bytes(self, data: bytes) -> None:
+        """Print already encoded text to the display."""
+        self.printout(data.decode('utf-8'))
+
     @abstractmethod
     def set_rgb(self, red: int, green: int, blue: int) -> None:
         """Set the RGB backlight color."""
@@ -102,6 +131,8 @@ class LCD:
         MAX_COLUMNS (int): Maximum number of columns (16)
         MAX_ROWS (int): Maximum number of rows (2)
         _lcd (LCDInterface): Underlying LCD implementation instance
+        _row_bufs (tuple): Encoded rows as last rendered by update, empty when unknown
+        _last_data (DisplayData): Last frame rendered by update, None when unknown
     """
 
     MAX_COLUMNS: int = 16
@@ -122,6 +153,8 @@ class LCD:
             self._lcd.set_cursor(0, 0)
         except Exception as e:
             raise LCDError(f"Failed to initialize LCD: {str(e)}")
+        self._row_bufs = (bytearray(), bytearray())
+        self._last_data: Optional[DisplayData] = None
 
     def display_message(self, line1: str, line2: str) -> None:
         """
@@ -137,8 +170,8 @@ class LCD:
         Raises:
             LCDError: If display operation fails
         """
-        if len(str(line1)) > self.MAX_COLUMNS or len(str(line2)) > self.MAX_COLUMNS:
-            return
+        line1 = (line1 if isinstance(line1, str) else str(line1))[:self.MAX_COLUMNS]
+        line2 = (line2 if isinstance(line2, str) else str(line2))[:self.MAX_COLUMNS]
         try:
             self.clear()
             self._write_line(line1, 0)
@@ -146,12 +179,12 @@ class LCD:
         except Exception as e:
             raise LCDError(f"Failed to display message: {str(e)}")
 
-    def _write_line(self, message: str, line: int) -> None:
+    def _write_line(self, message: Union[str, bytes], line: int) -> None:
         """
         Write a message to a specific line of the LCD.
         
         Args:
-            message: Text to display
+            message: Text to display, or already encoded bytes
             line: Line number (0 or 1)
             
         Raises:
@@ -159,10 +192,19 @@ class LCD:
         """
         try:
             self._lcd.set_cursor(0, line)
-            self._lcd.printout(message)
+            if isinstance(message, bytes):
+                self._lcd.printout_bytes(message)
+            else:
+                self._lcd.printout_str(message)
         except Exception as e:
             raise LCDError(f"Failed to write line: {str(e)}")
 
+    def _invalidate_rows(self) -> None:
+        """Forget the last rendered frame so the next update redraws it fully."""
+        self._last_data = None
+        for buf in self._row_bufs:
+            buf.clear()
+
     def clear(self) -> None:
         """
         Clear the LCD screen.
@@ -170,6 +212,7 @@ class LCD:
         Raises:
             LCDError: If clear operation fails
         """
+        self._invalidate_rows()
         try:
             self._lcd.clear()
         except Exception as e:
@@ -217,16 +260,11 @@ class LCD:
         Raises:
             LCDError: If color setting fails
         """
-        color_map = {
-            EventState.GREEN: LCDColor.GREEN,
-            EventState.YELLOW: LCDColor.YELLOW,
-            EventState.RED: LCDColor.RED,
-            EventState.BLACK: LCDColor.DARK_VIOLET,
-            EventState.UNKNOWN: LCDColor.GHOST_WHITE
-        }
-        self.set_backlight_color(color_map.get(event_state, LCDColor.GHOST_WHITE))
-
-    def _format_row_1(self, event_name: str, event_value: float) -> str:
+        idx = event_state.value - 1
+        color = _STATE_COLORS[idx] if 0 <= idx < len(_STATE_COLORS) else LCDColor.GHOST_WHITE
+        self.set_backlight_color(color)
+
+    def _format_row_1(self, event_name: str, event_value: float) -> bytes:
         """
         Format the first row of the display.
         
@@ -235,12 +273,14 @@ class LCD:
             event_value: Value of the event
             
         Returns:
-            Formatted string for first row
+            Encoded first row
         """
         formatted_value = str(round(event_value, 2))
-        return f"{event_name}: {formatted_value}" if len(event_name) + len(formatted_value) < self.MAX_COLUMNS else "Truncated Output"
+        if len(event_name) + len(formatted_value) < self.MAX_COLUMNS:
+            return f"{event_name}: {formatted_value}".encode('utf-8')
+        return b"Truncated Output"
 
-    def _format_row_2(self, temp: float, humidity: float, cpu: float) -> str:
+    def _format_row_2(self, temp: float, humidity: float, cpu: float) -> bytes:
         """
         Format the second row of the display.
         
@@ -250,13 +290,43 @@ class LCD:
             cpu: CPU usage value
             
         Returns:
-            Formatted string for second row
+            Encoded second row
+        """
+        return _ROW2_FMT % (int(temp % 100), int(humidity % 101), int(cpu % 101))
+
+    def _render_row(self, text: bytes, line: int) -> None:
         """
-        temp = int(temp % 100)
-        humidity = int(humidity % 101)
-        cpu = int(cpu % 101)
+        Write only the characters of a row that differ from the last render.
+        
+        The row is padded to MAX_COLUMNS so it always covers the whole line, and
+        each contiguous run of changed characters is sent with a single cursor
+        move and printout_bytes. The rendered row is copied into the row's
+        reusable buffer.
         
-        return f"T{temp:02d}*C H{humidity:02d}% P{cpu:03d}%"
+        Args:
+            text: Encoded text for the row
+            line: Line number (0 or 1)
+            
+        Raises:
+            LCDError: If write operation fails
+        """
+        text = text[:self.MAX_COLUMNS].ljust(self.MAX_COLUMNS)
+        last = self._row_bufs[line]
+        column = 0
+        while column < self.MAX_COLUMNS:
+            if column < len(last) and text[column] == last[column]:
+                column += 1
+                continue
+            end = column + 1
+            while end < self.MAX_COLUMNS and (end >= len(last) or text[end] != last[end]):
+                end += 1
+            try:
+                self._lcd.set_cursor(column, line)
+                self._lcd.printout_bytes(text[column:end])
+            except Exception as e:
+                raise LCDError(f"Failed to write line: {str(e)}")
+            column = end
+        last[:] = text
 
     def update(self, data: DisplayData) -> None:
         """
@@ -268,13 +338,17 @@ class LCD:
         Raises:
             LCDError: If update operation fails
         """
+        if data == self._last_data:
+            return
         try:
-            self.clear()
             self._set_background_color(data.event_state)
 
-            self._write_line(self._format_row_1(data.event_name, data.event_value), 0)
-            self._write_line(self._format_row_2(data.temperature, data.humidity, data.cpu_usage), 1)
+            self._render_row(self._format_row_1(data.event_name, data.event_value), 0)
+            self._render_row(self._format_row_2(data.temperature, data.humidity, data.cpu_usage), 1)
+            self._last_data = data
         except Exception as e:
+            # The screen content is unknown now, redraw everything next time
+            self._invalidate_rows()
             raise LCDError(f"Failed to update display: {str(e)}")
 
     def __del__(self) -> None:
@@ -13,9 +13,39 @@ This implementation is useful for:
 """
 
 import os
+import sys
 from typing import Optional, Union
 
-from .lcd import LCDInterface, EventState
+from .lcd import LCDInterface, LCDColor, EventState
+
+# Terminal background color per event state, indexed by EventState value - 1
+_STATE_COLORS = (
+    (0, 255, 0),
+    (255, 255, 0),
+    (255, 0, 0),
+    (0, 0, 0),
+    (128, 128, 128)
+)
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Clamp a value into [low, high] without going through min/max."""
+    return low if value < low else high if value > high else value
+
+
+def _ansi_bg(red: int, green: int, blue: int) -> str:
+    """Build the ANSI escape sequence for a 24-bit background color."""
+    return f"\x1b[48;2;{red};{green};{blue}m"
+
+
+# Background escape sequences for every color the display is known to use
+_ANSI_BG = {
+    color: _ansi_bg(*color)
+    for color in (
+        *(value for name, value in vars(LCDColor).items() if not name.startswith('_')),
+        *_STATE_COLORS
+    )
+}
 
 
 class MockLCD(LCDInterface):
@@ -31,8 +61,8 @@ class MockLCD(LCDInterface):
     Attributes:
         MAX_COLUMNS (int): Maximum number of columns (16)
         MAX_ROWS (int): Maximum number of rows (2)
-        _current_row1 (str): Current content of first row
-        _current_row2 (str): Current content of second row
+        _current_row1 (bytearray): Current content of first row
+        _current_row2 (bytearray): Current content of second row
         _current_color (tuple): Current RGB color values
     """
 
@@ -47,14 +77,17 @@ class MockLCD(LCDInterface):
             columns: Number of columns (16)
             rows: Number of rows (2)
         """
-        self._current_row1 = ""
-        self._current_row2 = ""
+        self._current_row1 = bytearray()
+        self._current_row2 = bytearray()
         self._current_color = (255, 255, 255)  # Default white
+        if os.name == 'nt':
+            os.system('')  # Enables ANSI escape processing in the Windows console
         self._clear_screen()
 
     def _clear_screen(self) -> None:
         """Clear the terminal screen using ANSI escape codes."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
     def _set_background_color(self, event_state: EventState) -> None:
         """
@@ -63,14 +96,8 @@ class MockLCD(LCDInterface):
         Args:
             event_state: Current event state
         """
-        color_map = {
-            EventState.GREEN: (0, 255, 0),
-            EventState.YELLOW: (255, 255, 0),
-            EventState.RED: (255, 0, 0),
-            EventState.BLACK: (0, 0, 0),
-            EventState.UNKNOWN: (128, 128, 128)
-        }
-        self.set_rgb(*color_map.get(event_state, (128, 128, 128)))
+        idx = event_state.value - 1
+        self.set_rgb(*(_STATE_COLORS[idx] if 0 <= idx < len(_STATE_COLORS) else (128, 128, 128)))
 
     def _format_row_1(self, event_name: str, event_state: EventState) -> str:
         """
@@ -101,10 +128,10 @@ class MockLCD(LCDInterface):
             Formatted string for second row
         """
         # Ensure values are within valid ranges
-        event_value = max(0, min(999, event_value))
-        temperature = max(-99, min(99, temperature))
-        humidity = max(0, min(99, humidity))
-        cpu_usage = max(0, min(99, cpu_usage))
+        event_value = _clamp(event_value, 0, 999)
+        temperature = _clamp(temperature, -99, 99)
+        humidity = _clamp(humidity, 0, 99)
+        cpu_usage = _clamp(cpu_usage, 0, 99)
         
         return f"{event_value:3.0f} {temperature:2.0f}C {humidity:2.0f}% {cpu_usage:2.0f}%"
 
@@ -114,8 +141,8 @@ class MockLCD(LCDInterface):
         
         Implements the abstract method from LCDInterface.
         """
-        self._current_row1 = ""
-        self._current_row2 = ""
+        self._current_row1.clear()
+        self._current_row2.clear()
         self._clear_screen()
 
     def set_cursor(self, column: int, row: int) -> None:
@@ -141,12 +168,33 @@ class MockLCD(LCDInterface):
             text: Text or number to display
         """
         if isinstance(text, int):
-            text = str(text)
+            self.printout_int(text)
+        else:
+            self.printout_str(text)
+
+    def printout_str(self, text: str) -> None:
+        """
+        Print a string to the display.
+        
+        Args:
+            text: Text to display
+        """
+        self.printout_bytes(text.encode())
+
+    def printout_bytes(self, data: bytes) -> None:
+        """
+        Print already encoded text to the display.
+        
+        Text fills the first row and spills over into the second; anything
+        beyond both rows is dropped.
+        
+        Args:
+            data: Encoded text to display
+        """
         # In mock implementation, text is stored in the current row
-        if len(self._current_row1) < self.MAX_COLUMNS:
-            self._current_row1 += text[:self.MAX_COLUMNS - len(self._current_row1)]
-        elif len(self._current_row2) < self.MAX_COLUMNS:
-            self._current_row2 += text[:self.MAX_COLUMNS - len(self._current_row2)]
+        room = max(self.MAX_COLUMNS - len(self._current_row1), 0)
+        self._current_row1.extend(data[:room])
+        self._current_row2.extend(data[room:room + self.MAX_COLUMNS - len(self._current_row2)])
 
     def set_rgb(self, red: int, green: int, blue: int) -> None:
         """
@@ -159,9 +207,10 @@ class MockLCD(LCDInterface):
             green: Green component (0-255)
             blue: Blue component (0-255)
         """
-        self._current_color = (red, green, blue)
+        color = (red, green, blue)
+        self._current_color = color
         # ANSI escape code for background color
-        print(f"\033[48;2;{red};{green};{blue}m", end='')
+        sys.stdout.write(_ANSI_BG.get(color) or _ansi_bg(red, green, blue))
 
     def display_message(self, row1: str, row2: str) -> None:
         """
@@ -179,8 +228,8 @@ class MockLCD(LCDInterface):
         row1 = row1.ljust(self.MAX_COLUMNS)
         row2 = row2.ljust(self.MAX_COLUMNS)
         
-        self._current_row1 = row1
-        self._current_row2 = row2
+        self._current_row1[:] = row1.encode()
+        self._current_row2[:] = row2.encode()
         
         # Clear screen and display message
         self._clear_screen()
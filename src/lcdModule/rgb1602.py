@@ -8,9 +8,9 @@ Reference:
     https://www.waveshare.com/wiki/LCD1602_RGB_Module
 """
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Final, Optional, Union
 
 from smbus import SMBus
 from .lcd import LCDInterface
@@ -26,57 +26,90 @@ class I2CError(LCDError):
     pass
 
 
-@dataclass
-class LCDRegisters:
-    """LCD register addresses and flags."""
-    # Device I2C Addresses
-    LCD_ADDRESS: int = 0x7c >> 1
-    RGB_ADDRESS: int = 0xc0 >> 1
-
-    # RGB Backlight Registers
-    REG_RED: int = 0x04
-    REG_GREEN: int = 0x03
-    REG_BLUE: int = 0x02
-    REG_MODE1: int = 0x00
-    REG_MODE2: int = 0x01
-    REG_OUTPUT: int = 0x08
-
-    # LCD Commands
-    LCD_CLEARDISPLAY: int = 0x01
-    LCD_RETURNHOME: int = 0x02
-    LCD_ENTRYMODESET: int = 0x04
-    LCD_DISPLAYCONTROL: int = 0x08
-    LCD_CURSORSHIFT: int = 0x10
-    LCD_FUNCTIONSET: int = 0x20
-    LCD_SETCGRAMADDR: int = 0x40
-    LCD_SETDDRAMADDR: int = 0x80
-
-    # Display Entry Mode Flags
-    LCD_ENTRYRIGHT: int = 0x00
-    LCD_ENTRYLEFT: int = 0x02
-    LCD_ENTRYSHIFTINCREMENT: int = 0x01
-    LCD_ENTRYSHIFTDECREMENT: int = 0x00
-
-    # Display Control Flags
-    LCD_DISPLAYON: int = 0x04
-    LCD_DISPLAYOFF: int = 0x00
-    LCD_CURSORON: int = 0x02
-    LCD_CURSOROFF: int = 0x00
-    LCD_BLINKON: int = 0x01
-    LCD_BLINKOFF: int = 0x00
-
-    # Display/Cursor Shift Flags
-    LCD_DISPLAYMOVE: int = 0x08
-    LCD_CURSORMOVE: int = 0x00
-    LCD_MOVERIGHT: int = 0x04
-    LCD_MOVELEFT: int = 0x00
-
-    # Function Set Flags
-    LCD_8BITMODE: int = 0x10
-    LCD_4BITMODE: int = 0x00
-    LCD_2LINE: int = 0x08
-    LCD_1LINE: int = 0x00
-    LCD_5x8DOTS: int = 0x00
+# Device I2C Addresses
+LCD_ADDRESS: Final[int] = 0x7c >> 1
+RGB_ADDRESS: Final[int] = 0xc0 >> 1
+
+# RGB Backlight Registers
+REG_RED: Final[int] = 0x04
+REG_GREEN: Final[int] = 0x03
+REG_BLUE: Final[int] = 0x02
+REG_MODE1: Final[int] = 0x00
+REG_MODE2: Final[int] = 0x01
+REG_OUTPUT: Final[int] = 0x08
+# Control register flag enabling register auto-increment on the backlight chip
+REG_AUTO_INCREMENT: Final[int] = 0x80
+
+# LCD Commands
+LCD_CLEARDISPLAY: Final[int] = 0x01
+LCD_RETURNHOME: Final[int] = 0x02
+LCD_ENTRYMODESET: Final[int] = 0x04
+LCD_DISPLAYCONTROL: Final[int] = 0x08
+LCD_CURSORSHIFT: Final[int] = 0x10
+LCD_FUNCTIONSET: Final[int] = 0x20
+LCD_SETCGRAMADDR: Final[int] = 0x40
+LCD_SETDDRAMADDR: Final[int] = 0x80
+
+# Display Entry Mode Flags
+LCD_ENTRYRIGHT: Final[int] = 0x00
+LCD_ENTRYLEFT: Final[int] = 0x02
+LCD_ENTRYSHIFTINCREMENT: Final[int] = 0x01
+LCD_ENTRYSHIFTDECREMENT: Final[int] = 0x00
+
+# Display Control Flags
+LCD_DISPLAYON: Final[int] = 0x04
+LCD_DISPLAYOFF: Final[int] = 0x00
+LCD_CURSORON: Final[int] = 0x02
+LCD_CURSOROFF: Final[int] = 0x00
+LCD_BLINKON: Final[int] = 0x01
+LCD_BLINKOFF: Final[int] = 0x00
+
+# Display/Cursor Shift Flags
+LCD_DISPLAYMOVE: Final[int] = 0x08
+LCD_CURSORMOVE: Final[int] = 0x00
+LCD_MOVERIGHT: Final[int] = 0x04
+LCD_MOVELEFT: Final[int] = 0x00
+
+# Function Set Flags
+LCD_8BITMODE: Final[int] = 0x10
+LCD_4BITMODE: Final[int] = 0x00
+LCD_2LINE: Final[int] = 0x08
+LCD_1LINE: Final[int] = 0x00
+LCD_5x8DOTS: Final[int] = 0x00
+
+
+# The I2C bus is shared by every driver instance and only closed with the last one
+_bus_singleton: Optional[SMBus] = None
+_bus_refcount: int = 0
+_bus_lock = threading.Lock()
+
+
+def _acquire_bus() -> SMBus:
+    """
+    Get the shared I2C bus, opening it if no driver holds it yet.
+    
+    Returns:
+        SMBus: The shared bus
+    """
+    global _bus_singleton, _bus_refcount
+    with _bus_lock:
+        if _bus_singleton is None:
+            _bus_singleton = SMBus(1)
+        _bus_refcount += 1
+        return _bus_singleton
+
+
+def _release_bus() -> None:
+    """Drop a reference to the shared I2C bus, closing it when none remain."""
+    global _bus_singleton, _bus_refcount
+    with _bus_lock:
+        _bus_refcount -= 1
+        if _bus_refcount <= 0 and _bus_singleton is not None:
+            try:
+                _bus_singleton.close()
+            finally:
+                _bus_singleton = None
+                _bus_refcount = 0
 
 
 class RGB1602(LCDInterface):
@@ -87,14 +120,14 @@ class RGB1602(LCDInterface):
     through I2C interface.
     
     Attributes:
-        _bus (SMBus): I2C bus interface
-        _registers (LCDRegisters): Register addresses and flags
+        _bus (SMBus): I2C bus interface, shared between instances
         _num_lines (int): Number of display lines
         _curr_line (int): Current cursor line
         _show_function (int): Display function flags
         _show_control (int): Display control flags
         _show_mode (int): Display mode flags
         _last_rgb (tuple): Last set RGB color values
+        _next_cmd_deadline (float): Monotonic time before which the LCD controller is busy
     """
 
     # Timing constants (in seconds)
@@ -102,6 +135,9 @@ class RGB1602(LCDInterface):
     COMMAND_DELAY: float = 0.005
     CLEAR_DELAY: float = 0.002
 
+    # Maximum payload of a single SMBus block write
+    I2C_BLOCK_SIZE: int = 32
+
     def __init__(self, columns: int, rows: int) -> None:
         """
         Initialize the RGB1602 driver.
@@ -114,19 +150,36 @@ class RGB1602(LCDInterface):
             I2CError: If I2C communication fails
         """
         try:
-            self._bus = SMBus(1)
-            self._registers = LCDRegisters()
+            self._bus = _acquire_bus()
             self._num_lines = rows
             self._curr_line = 0
-            self._show_function = self._registers.LCD_4BITMODE | self._registers.LCD_1LINE | self._registers.LCD_5x8DOTS
+            self._show_function = LCD_4BITMODE | LCD_1LINE | LCD_5x8DOTS
             self._last_rgb = (255, 255, 255)  # Default white
+            self._next_cmd_deadline = 0.0
             self.begin(rows, columns)
         except Exception as e:
             raise I2CError(f"Failed to initialize I2C bus: {str(e)}")
 
+    def _wait_ready(self, address: int) -> None:
+        """
+        Wait out whatever remains of the LCD controller's busy interval.
+        
+        Only writes to the LCD controller wait; the backlight chip is independent.
+        
+        Args:
+            address: I2C device address about to be written
+        """
+        if address == LCD_ADDRESS:
+            remaining = self._next_cmd_deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+
     def _safe_write(self, address: int, register: int, value: int) -> None:
         """
-        Safely write a value to an I2C register with error handling.
+        Write a value to an I2C register.
+        
+        Errors are not translated here; the public entry points that issue
+        bulk transfers (printout, begin) wrap them in I2CError once.
         
         Args:
             address: I2C device address
@@ -134,12 +187,28 @@ class RGB1602(LCDInterface):
             value: Value to write
             
         Raises:
-            I2CError: If write operation fails
+            OSError: If write operation fails
         """
-        try:
-            self._bus.write_byte_data(address, register, value)
-        except Exception as e:
-            raise I2CError(f"Failed to write to I2C register: {str(e)}")
+        self._wait_ready(address)
+        self._bus.write_byte_data(address, register, value)
+
+    def write_block(self, address: int, register: int, data: bytes) -> None:
+        """
+        Write a run of bytes to an I2C register in as few transactions as possible.
+        
+        Data is sent as SMBus block writes of at most I2C_BLOCK_SIZE bytes each.
+        
+        Args:
+            address: I2C device address
+            register: Register address
+            data: Bytes to write
+            
+        Raises:
+            OSError: If write operation fails
+        """
+        self._wait_ready(address)
+        for start in range(0, len(data), self.I2C_BLOCK_SIZE):
+            self._bus.write_i2c_block_data(address, register, list(data[start:start + self.I2C_BLOCK_SIZE]))
 
     def command(self, cmd: int) -> None:
         """
@@ -149,9 +218,9 @@ class RGB1602(LCDInterface):
             cmd: Command byte to send
             
         Raises:
-            I2CError: If command fails
+            OSError: If command fails
         """
-        self._safe_write(self._registers.LCD_ADDRESS, 0x80, cmd)
+        self._safe_write(LCD_ADDRESS, 0x80, cmd)
 
     def write(self, data: int) -> None:
         """
@@ -161,9 +230,9 @@ class RGB1602(LCDInterface):
             data: Data byte to write
             
         Raises:
-            I2CError: If write fails
+            OSError: If write fails
         """
-        self._safe_write(self._registers.LCD_ADDRESS, 0x40, data)
+        self._safe_write(LCD_ADDRESS, 0x40, data)
 
     def set_reg(self, reg: int, data: int) -> None:
         """
@@ -174,9 +243,9 @@ class RGB1602(LCDInterface):
             data: Data to write to register
             
         Raises:
-            I2CError: If register write fails
+            OSError: If register write fails
         """
-        self._safe_write(self._registers.RGB_ADDRESS, reg, data)
+        self._safe_write(RGB_ADDRESS, reg, data)
 
     def clear(self) -> None:
         """
@@ -185,13 +254,11 @@ class RGB1602(LCDInterface):
         Implements the abstract method from LCDInterface.
         
         Raises:
-            I2CError: If clear operation fails
+            OSError: If clear operation fails
         """
-        try:
-            self.command(self._registers.LCD_CLEARDISPLAY)
-            time.sleep(self.CLEAR_DELAY)
-        except Exception as e:
-            raise I2CError(f"Failed to clear display: {str(e)}")
+        self.command(LCD_CLEARDISPLAY)
+        # Don't stall here, the next LCD write waits out the remainder
+        self._next_cmd_deadline = time.monotonic() + self.CLEAR_DELAY
 
     def set_cursor(self, column: int, row: int) -> None:
         """
@@ -204,16 +271,9 @@ class RGB1602(LCDInterface):
             row: Row position (0-1)
             
         Raises:
-            I2CError: If cursor positioning fails
+            OSError: If cursor positioning fails
         """
-        try:
-            if row == 0:
-                column |= 0x80
-            else:
-                column |= 0xc0
-            self.command(column)
-        except Exception as e:
-            raise I2CError(f"Failed to set cursor: {str(e)}")
+        self.command(column | (0x80 if row == 0 else 0xc0))
 
     def printout(self, text: Union[str, int]) -> None:
         """
@@ -224,14 +284,40 @@ class RGB1602(LCDInterface):
         Args:
             text: Text or number to display
             
+        Raises:
+            I2CError: If text printing fails
+        """
+        if isinstance(text, int):
+            self.printout_int(text)
+        else:
+            self.printout_str(text)
+
+    def printout_str(self, text: str) -> None:
+        """
+        Print a string to the display.
+        
+        Args:
+            text: Text to display
+            
+        Raises:
+            I2CError: If text printing fails
+        """
+        self.printout_bytes(text.encode('utf-8'))
+
+    def printout_bytes(self, data: bytes) -> None:
+        """
+        Print already encoded text to the display.
+        
+        Skips the str to bytes conversion of printout.
+        
+        Args:
+            data: Encoded text to display
+            
         Raises:
             I2CError: If text printing fails
         """
         try:
-            if isinstance(text, int):
-                text = str(text)
-            for char in text.encode('utf-8'):
-                self.write(char)
+            self.write_block(LCD_ADDRESS, 0x40, data)
         except Exception as e:
             raise I2CError(f"Failed to print text: {str(e)}")
 
@@ -247,17 +333,17 @@ class RGB1602(LCDInterface):
             blue: Blue component (0-255)
             
         Raises:
-            I2CError: If color setting fails
+            OSError: If color setting fails
         """
-        try:
-            # Only update if color has changed
-            if (red, green, blue) != self._last_rgb:
-                self.set_reg(self._registers.REG_RED, red)
-                self.set_reg(self._registers.REG_GREEN, green)
-                self.set_reg(self._registers.REG_BLUE, blue)
-                self._last_rgb = (red, green, blue)
-        except Exception as e:
-            raise I2CError(f"Failed to set RGB color: {str(e)}")
+        # Only update if color has changed
+        if (red, green, blue) != self._last_rgb:
+            # REG_BLUE..REG_RED are contiguous, so one auto-incrementing block covers all three
+            self.write_block(
+                RGB_ADDRESS,
+                REG_AUTO_INCREMENT | REG_BLUE,
+                bytes((blue, green, red))
+            )
+            self._last_rgb = (red, green, blue)
 
     def begin(self, rows: int, columns: int) -> None:
         """
@@ -272,36 +358,36 @@ class RGB1602(LCDInterface):
         """
         try:
             if rows > 1:
-                self._show_function |= self._registers.LCD_2LINE
+                self._show_function |= LCD_2LINE
 
             self._num_lines = rows
             self._curr_line = 0
 
             time.sleep(self.INIT_DELAY)
 
-            # Send function set command sequence
-            for _ in range(3):
-                self.command(self._registers.LCD_FUNCTIONSET | self._show_function)
-                time.sleep(self.COMMAND_DELAY)
+            # Send function set command sequence as one command stream (control
+            # byte 0x00), then wait once for all three to be latched
+            self.write_block(LCD_ADDRESS, 0x00, bytes((LCD_FUNCTIONSET | self._show_function,) * 3))
+            time.sleep(self.COMMAND_DELAY * 3)
             
             # Set display lines, font size, etc.
-            self.command(self._registers.LCD_FUNCTIONSET | self._show_function)
+            self.command(LCD_FUNCTIONSET | self._show_function)
             
             # Turn on display with no cursor or blinking
-            self._show_control = self._registers.LCD_DISPLAYON | self._registers.LCD_CURSOROFF | self._registers.LCD_BLINKOFF
+            self._show_control = LCD_DISPLAYON | LCD_CURSOROFF | LCD_BLINKOFF
             self.display()
             
             # Clear display
             self.clear()
             
             # Set text direction (left to right)
-            self._show_mode = self._registers.LCD_ENTRYLEFT | self._registers.LCD_ENTRYSHIFTDECREMENT
-            self.command(self._registers.LCD_ENTRYMODESET | self._show_mode)
+            self._show_mode = LCD_ENTRYLEFT | LCD_ENTRYSHIFTDECREMENT
+            self.command(LCD_ENTRYMODESET | self._show_mode)
 
             # Initialize RGB backlight
-            self.set_reg(self._registers.REG_MODE1, 0)
-            self.set_reg(self._registers.REG_OUTPUT, 0xFF)
-            self.set_reg(self._registers.REG_MODE2, 0x20)
+            self.set_reg(REG_MODE1, 0)
+            self.set_reg(REG_OUTPUT, 0xFF)
+            self.set_reg(REG_MODE2, 0x20)
 
             self.set_color_white()
         except Exception as e:
@@ -312,20 +398,17 @@ class RGB1602(LCDInterface):
         Turn on the display.
         
         Raises:
-            I2CError: If display control fails
+            OSError: If display control fails
         """
-        try:
-            self._show_control |= self._registers.LCD_DISPLAYON
-            self.command(self._registers.LCD_DISPLAYCONTROL | self._show_control)
-        except Exception as e:
-            raise I2CError(f"Failed to control display: {str(e)}")
+        self._show_control |= LCD_DISPLAYON
+        self.command(LCD_DISPLAYCONTROL | self._show_control)
 
     def set_color_white(self) -> None:
         """
         Set the backlight to white.
         
         Raises:
-            I2CError: If color setting fails
+            OSError: If color setting fails
         """
         self.set_rgb(255, 255, 255)
 
@@ -334,5 +417,6 @@ class RGB1602(LCDInterface):
         if hasattr(self, '_bus'):
             try:
                 del self._bus
+                _release_bus()
             except Exception:
                 pass  # Ignore cleanup errors
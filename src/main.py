@@ -6,11 +6,15 @@ This module implements the core functionality of the Cyclops Edge Application,
 managing multiple processes for sensor data collection, inference, telemetry,
 """
 
+import asyncio
 import multiprocessing
+import multiprocessing.synchronize
+import os
+import threading
 import time
 import traceback
 from datetime import datetime
-from multiprocessing import Process as BaseProcess, Semaphore
+from multiprocessing import Process as BaseProcess
 from typing import List, Optional, Tuple, Any, Dict
 from time import sleep
 
@@ -24,14 +28,17 @@ from .miModule.inference_engine import InferenceEngine
 from .iotGateway.client import get_thingsboard_client
 from .telemetryDatabase.database import Database as TelemetryDatabase
 from .utils.ip_utility import IPUtility
+from .utils.prediction_ring import PredictionRing
 from .sensorModule.sensor_interface import SensorInterface
+import constants as const
 import utils
 
 # Load environment variables
 load_dotenv()
 
-# Global semaphore for telemetry database access
-telemetry_db_semaphore = Semaphore(1)
+# Telemetry database access is not guarded by a cross-process lock: the sensor
+# process is its only writer of samples, and SQLite's own file locking (WAL mode
+# with a busy timeout) serializes it against the log updates and cleanup.
 
 
 class Process(BaseProcess):
@@ -39,45 +46,61 @@ class Process(BaseProcess):
     Enhanced Process class with improved error handling and communication.
     
     This class extends the base multiprocessing.Process to provide better
-    error handling and inter-process communication capabilities.
+    error handling and inter-process communication capabilities. Failures are
+    reported through shared memory, so checking a process is a plain memory
+    read rather than a syscall.
     
     Attributes:
-        _parent_conn: Parent end of the inter-process communication pipe
-        _child_conn: Child end of the inter-process communication pipe
+        _status: Shared exit status, STATUS_RUNNING until the target returns
+            (STATUS_OK) or raises (STATUS_FAILED)
+        _traceback: Shared buffer holding the tail of the child's formatted traceback
         _exception: Stores any exception that occurs during process execution
     """
     
+    TRACEBACK_SIZE = 4096
+    STATUS_RUNNING = -1
+    STATUS_OK = 0
+    STATUS_FAILED = 1
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialize the Process with communication pipes."""
+        """Initialize the Process with its shared failure state."""
         super().__init__(*args, **kwargs)
-        self._parent_conn, self._child_conn = multiprocessing.Pipe()
+        self._status = multiprocessing.Value('i', self.STATUS_RUNNING, lock=False)
+        self._traceback = multiprocessing.Array('c', self.TRACEBACK_SIZE, lock=False)
         self._exception: Optional[Tuple[Exception, str]] = None
 
     def run(self) -> None:
         """
         Override the run method to handle exceptions and communicate them.
         
-        Any exceptions during execution are captured and sent through the pipe
-        to the parent process.
+        Any exception during execution is formatted into the shared traceback
+        buffer before the status is set, so the parent never sees a failure
+        without its traceback.
         """
         try:
+            utils.get_logger()  # Attach the log handler in the child, it is not inherited
             super().run()
-            self._child_conn.send(None)
-        except Exception as e:
-            tb = traceback.format_exc()
-            self._child_conn.send((e, tb))
+            self._status.value = self.STATUS_OK
+        except Exception:
+            tb = traceback.format_exc().encode('utf-8', 'replace')
+            self._traceback.raw = tb[-self.TRACEBACK_SIZE:].ljust(self.TRACEBACK_SIZE, b'\0')
+            self._status.value = self.STATUS_FAILED
 
     @property
     def exception(self) -> Optional[Tuple[Exception, str]]:
         """
         Get any exception that occurred during process execution.
         
+        The exception object itself stays in the child; it is rebuilt as a
+        ChildProcessError carrying the last line of the traceback.
+        
         Returns:
             Optional[Tuple[Exception, str]]: Exception and traceback if an error occurred,
             None otherwise.
         """
-        if self._parent_conn.poll():
-            self._exception = self._parent_conn.recv()
+        if self._exception is None and self._status.value == self.STATUS_FAILED:
+            tb = self._traceback.value.decode('utf-8', 'replace')
+            self._exception = (ChildProcessError(tb.strip().rsplit('\n', 1)[-1]), tb)
         return self._exception
 
 
@@ -93,8 +116,15 @@ class ProcessManager:
         mi_database: Database instance for machine intelligence data
         logger: Logger instance for application logging
         running_processes: List of currently running processes
+        baseline_ready: Set by the sensor process once enough samples for the
+            baseline have been stored
+        prediction_ring: Hands new predictions from the MI process to the IoT process
+        _ready_barrier: Tripped by every child once it has initialized
     """
     
+    PROCESS_START_TIMEOUT = 60
+    CPU_REFRESH_INTERVAL = 2.0
+    
     def __init__(
         self,
         telemetry_database: TelemetryDatabase,
@@ -108,6 +138,43 @@ class ProcessManager:
         self.running_processes: List[Process] = []
         self.config = utils.load_config('app_config')
         self.process_fail_count = 0
+        self.baseline_ready = multiprocessing.Event()
+        self.prediction_ring = PredictionRing(utils.load_config()['supported_analytes'])
+        self._ready_barrier: Optional[multiprocessing.synchronize.Barrier] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the parent's process and database handles out when pickling for a child.
+        
+        Each child opens its own database connections.
+        """
+        state = self.__dict__.copy()
+        state['running_processes'] = []
+        state['telemetry_database'] = state['mi_database'] = None
+        return state
+
+    def _signal_ready(self) -> None:
+        """Report that the calling process has finished initializing."""
+        try:
+            self._ready_barrier.wait(timeout=self.PROCESS_START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass  # A sibling failed to start; the monitor handles it
+
+    def _pin_to_cpus(self, role: str, logger: Any) -> None:
+        """Restrict the calling process to the CPUs configured for its role.
+        
+        Roles without an entry in app_config.cpu_affinity, CPUs this machine
+        does not have, and platforms without sched_setaffinity are left alone.
+        
+        Args:
+            role: Key of the process in app_config.cpu_affinity
+            logger: Logger instance
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            return
+        cpus = set(self.config.get('cpu_affinity', {}).get(role, ())) & os.sched_getaffinity(0)
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+            logger.info(f'Pinned {role} process to CPUs {sorted(cpus)}')
 
     def start_processes(self) -> None:
         """Start all required processes for the application."""
@@ -118,52 +185,60 @@ class ProcessManager:
             self._run_iot_process,
             self._run_db_cleanup_process
         ]
+        self._ready_barrier = multiprocessing.Barrier(len(process_functions) + 1)
         
         for process_func in process_functions:
             process = Process(
                 target=process_func,
                 name=process_func.__name__,
-                args=(self.telemetry_database, self.mi_database, self.logger)
+                args=(self.logger,)
             )
             self.running_processes.append(process)
             process.start()
         
-        sleep(5)  # Allow processes to initialize
+        # Wait for every process to initialize
+        try:
+            self._ready_barrier.wait(timeout=self.PROCESS_START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            self.logger.warning("Not all processes initialized in time")
         self.logger.info(f"Current running processes: {self.running_processes}")
 
     def _run_sensor_process(
         self,
-        telemetry_database: TelemetryDatabase,
-        mi_database: MiDatabase,
         logger: Any
     ) -> None:
         """
         Process for collecting and storing sensor data.
         
         Continuously reads sensor data and stores it in the telemetry database.
+        Blocks on the sensor's sample queue, then writes the sample together
+        with any others already queued as one batch.
         """
+        self._pin_to_cpus('sensor', logger)
         logger.info('Initiating sensor process')
+        telemetry_database = TelemetryDatabase.get_instance()
         sensor_interface = SensorInterface()
+        baseline_count = utils.load_config()['data_config']['baseline_count']
+        if telemetry_database.get_nb_of_telemetry_log() >= baseline_count:
+            self.baseline_ready.set()
+        self._signal_ready()
         
         while True:
-            sleep(0.5)  # Prevent CPU overuse
-            nb_of_samples = sensor_interface.getNbOfSamplesCollected()
-            if nb_of_samples == 0:
+            sample = sensor_interface.get_sample(timeout=const.SENSOR_SAMPLE_TIMEOUT)
+            if sample is None:
                 continue
-                
-            for _ in range(nb_of_samples):
-                if telemetry_db_semaphore.acquire(block=False):
-                    try:
-                        telemetry_database.write(sensor_interface.getSample())
-                    finally:
-                        telemetry_db_semaphore.release()
-                else:
-                    break
+
+            nb_of_samples = min(sensor_interface.get_sample_count(), const.SENSOR_WRITE_BATCH_SIZE - 1)
+            samples = [sample]
+            samples.extend(sensor_interface.get_sample(timeout=0) for _ in range(nb_of_samples))
+            telemetry_database.write_many(samples)
+            sensor_interface.release_samples(samples)
+
+            if not self.baseline_ready.is_set() and telemetry_database.get_nb_of_telemetry_log() >= baseline_count:
+                self.baseline_ready.set()
 
     def _run_iot_process(
         self,
-        telemetry_database: TelemetryDatabase,
-        mi_database: MiDatabase,
         logger: Any
     ) -> None:
         """
@@ -171,38 +246,67 @@ class ProcessManager:
         
         Manages the sending of telemetry and prediction data to the IoT broker.
         """
+        self._pin_to_cpus('iot', logger)
         logger.info('Initiating IoT process')
+        telemetry_database = TelemetryDatabase.get_instance()
+        mi_database = MiDatabase.get_instance()
+        self._signal_ready()
+        asyncio.run(self._iot_loop(telemetry_database, mi_database))
+
+    async def _iot_loop(
+        self,
+        telemetry_database: TelemetryDatabase,
+        mi_database: MiDatabase
+    ) -> None:
+        """
+        Publish unsent telemetry and predictions with the async ThingsBoard client.
+        
+        Each pass fetches unsent telemetry logs in one query, sends them in
+        order until a send fails, and marks the sent logs with one UPDATE.
+        Unsent predictions are sent the same way, in chunks of
+        PREDICTION_SEND_CHUNK_SIZE dates; chunks already marked sent are not
+        fetched again, so the next pass resumes after a failure.
+        New predictions are taken straight from the prediction ring and
+        marked sent by log ID and prediction date; the database is only swept
+        for predictions the ring missed or failed to send. Publishing one
+        twice is harmless since ThingsBoard keys them by timestamp. The broker
+        connection is kept open across passes and only re-established after it
+        drops.
+        """
         tb_mqtt = get_thingsboard_client()
         
         while True:
-            sleep(0.5)  # Prevent CPU overuse
-            if not tb_mqtt.connect():
+            await asyncio.sleep(0.5)  # Prevent CPU overuse
+            if not tb_mqtt.is_connected and not await tb_mqtt.connect():
+                await asyncio.sleep(1)
                 continue
 
             # Handle telemetry data
-            mqtt_list = telemetry_database.get_unsent_mqtt_logs()
-            for log_id in mqtt_list:
-                payload = telemetry_database.get_unsent_mqtt_log(log_id)
-                if tb_mqtt.sendTelemetryPayload(payload) is None:
+            sent_log_ids = []
+            for log_id, payload in telemetry_database.get_unsent_mqtt_payloads():
+                if not await tb_mqtt.send_telemetry(payload):
                     break
-                    
-                if telemetry_db_semaphore.acquire(block=True):
-                    try:
-                        if tb_mqtt.connect():
-                            telemetry_database.update_log_sent_mqtt(log_id, True)
-                    finally:
-                        telemetry_db_semaphore.release()
-
-            # Handle prediction data
+                sent_log_ids.append(log_id)
+            telemetry_database.bulk_mark_sent(sent_log_ids)
+
+            # Handle new predictions
+            records = self.prediction_ring.drain()
+            if records and await tb_mqtt.send_predictions({date: results for _, date, results in records}):
+                mi_database.mark_predictions_sent([(log_id, date) for log_id, date, _ in records])
+
+            # Handle prediction data left in the database
             predictions = mi_database.get_unsent_mqtt_predictions()
-            if tb_mqtt.sendPredictionPayload(predictions["logs"]) is not None:
-                for prediction_id in predictions["ids"]:
-                    mi_database.update_sent_mqtt_predictions(prediction_id, True)
+            dates = list(predictions["logs"])
+            for start in range(0, len(dates), const.PREDICTION_SEND_CHUNK_SIZE):
+                chunk = dates[start:start + const.PREDICTION_SEND_CHUNK_SIZE]
+                if not await tb_mqtt.send_predictions({date: predictions["logs"][date] for date in chunk}):
+                    break
+                mi_database.update_sent_mqtt_predictions_bulk(
+                    [prediction_id for date in chunk for prediction_id in predictions["ids_by_date"][date]]
+                )
 
     def _run_mi_detection_process(
         self,
-        telemetry_database: TelemetryDatabase,
-        mi_database: MiDatabase,
         logger: Any
     ) -> None:
         """
@@ -210,52 +314,54 @@ class ProcessManager:
         
         Handles baseline establishment and continuous inference on sensor data.
         """
+        self._pin_to_cpus('mi_detection', logger)
         logger.info('Initiating MI detection process')
+        telemetry_database = TelemetryDatabase.get_instance()
+        mi_database = MiDatabase.get_instance()
         config = utils.load_config()
-        mi_detection_count = 0
+        self._signal_ready()
 
         # Wait for baseline establishment
-        while True:
-            baseline = telemetry_database.get_baseline(config['data_config']['baseline_count'])
-            if baseline is not None:
-                break
+        if not self.baseline_ready.is_set():
             logger.info('Establishing Baseline')
+            self.baseline_ready.wait()
+        baseline = telemetry_database.get_baseline(config['data_config']['baseline_count'])
+
+        meta_data = telemetry_database.get_latest_meta_data()
+
+        # Event detection runs alongside inference and is woken on each new prediction
+        event_engine = EventEngine(database=mi_database, metadata=meta_data)
+        threading.Thread(target=event_engine.run, name='event-engine', daemon=True).start()
+
+        inference_engine = InferenceEngine()
 
         while True:
             sleep(config['pred_config']['prediction_delay'])
 
-            with telemetry_db_semaphore:
-                last_log_id, last_sensor_value = telemetry_database.get_last_log_and_sensor_Values()
-                meta_data = telemetry_database.get_latest_meta_data()
+            last_log_id, last_sensor_value = telemetry_database.get_last_log_and_sensor_Values()
+            meta_data = telemetry_database.get_latest_meta_data()
 
             if last_sensor_value is None:
                 logger.info('Sensor telemetry Not logged')
                 continue
 
             # Run inference
-            inference_engine = InferenceEngine()
             results = inference_engine.run_inference(
                 data=last_sensor_value,
                 baseline=baseline
             )
             
-            mi_database.save_prediction(last_log_id, results, datetime.now())
-            mi_detection_count += 1
-
-            # Run event engine if delay threshold reached
-            if mi_detection_count >= config['event_config']['event_delay']:
-                logger.info('Initiating event detection')
-                event_engine = EventEngine(
-                    data_base_instance=mi_database,
-                    meta_data=meta_data
-                )
-                event_engine.run_event_engine()
-                mi_detection_count = 0
+            # Publish through the ring only once the rows exist, so the IoT
+            # process can mark them sent
+            prediction_time = datetime.now()
+            if mi_database.save_prediction(last_log_id, results, prediction_time):
+                self.prediction_ring.put(last_log_id, results, prediction_time)
+
+            event_engine.update_metadata(meta_data)
+            event_engine.notify_new_prediction()
 
     def _run_ui_process(
         self,
-        telemetry_database: TelemetryDatabase,
-        mi_database: MiDatabase,
         logger: Any
     ) -> None:
         """
@@ -263,28 +369,32 @@ class ProcessManager:
         
         Manages the LCD display and updates it with current system status.
         """
+        self._pin_to_cpus('ui', logger)
         logger.info('Initiating UI process')
+        telemetry_database = TelemetryDatabase.get_instance()
+        mi_database = MiDatabase.get_instance()
         config = utils.load_config("ui_config")
-        baseline_config = utils.load_config()
         lcd = LCD()
+        self._signal_ready()
         
         # Initial display
         lcd.screen_message("CYCLOPS", f"IP:{IPUtility.get_ip()}")
         time.sleep(3)
 
         # Wait for baseline if needed
-        if telemetry_database.get_baseline(baseline_config['data_config']['baseline_count']) is None:
+        if not self.baseline_ready.is_set():
             lcd.screen_message("  Establishing  ", "    Baseline    ")
-            while True:
-                if telemetry_database.get_baseline(baseline_config['data_config']['baseline_count']) is not None:
-                    break
-                time.sleep(1)
+            self.baseline_ready.wait()
 
-        # Main UI loop
+        # Main UI loop; CPU usage is sampled at most every CPU_REFRESH_INTERVAL
+        cpu = psutil.cpu_percent(interval=None)
+        cpu_sampled_at = time.monotonic()
         while True:
             event_details = mi_database.get_event_details()
             for event_detail in event_details:
-                cpu = psutil.cpu_percent()
+                if time.monotonic() - cpu_sampled_at > self.CPU_REFRESH_INTERVAL:
+                    cpu = psutil.cpu_percent(interval=None)
+                    cpu_sampled_at = time.monotonic()
                 lcd.update(
                     event_detail['event_name'],
                     event_detail['event_state'],
@@ -297,8 +407,6 @@ class ProcessManager:
 
     def _run_db_cleanup_process(
         self,
-        telemetry_database: TelemetryDatabase,
-        mi_database: MiDatabase,
         logger: Any
     ) -> None:
         """
@@ -306,27 +414,29 @@ class ProcessManager:
         
         Handles periodic cleanup of databases to maintain size limits.
         """
+        self._pin_to_cpus('db_cleanup', logger)
         logger.info('Initiating DB cleanup process')
+        telemetry_database = TelemetryDatabase.get_instance()
+        mi_database = MiDatabase.get_instance()
         config = utils.load_config('db_config')
+        self._signal_ready()
         
         while True:
             sleep(config['db_cleanup_delay'])
             
             # Clean MI database if needed
-            if mi_database.get_db_size() > config['db_size']:
-                logger.info(f'Cleaning up MI database size: {mi_database.get_db_size()}')
+            size = mi_database.get_db_size()
+            if size > config['db_size']:
+                logger.info(f'Cleaning up MI database size: {size}')
                 mi_database.clean_mi_db()
-                logger.info(f'Reduced MI database size: {mi_database.get_db_size()}')
+                logger.info(f'Reduced MI database size from {size} to {mi_database.get_db_size()}')
 
             # Clean telemetry database if needed
-            if telemetry_database.get_db_size() > config['db_size']:
-                if telemetry_db_semaphore.acquire(timeout=1):
-                    try:
-                        logger.info(f'Cleaning up telemetry database size: {telemetry_database.get_db_size()}')
-                        telemetry_database.clean_telemetry_db()
-                        logger.info(f"Reduced telemetry database size: {telemetry_database.get_db_size()}")
-                    finally:
-                        telemetry_db_semaphore.release()
+            size = telemetry_database.get_db_size()
+            if size > config['db_size']:
+                logger.info(f'Cleaning up telemetry database size: {size}')
+                telemetry_database.clean_telemetry_db()
+                logger.info(f"Reduced telemetry database size from {size} to {telemetry_database.get_db_size()}")
 
     def monitor_processes(self) -> None:
         """
@@ -352,10 +462,10 @@ class ProcessManager:
                     self.cleanup_processes()
                     self.start_processes()
                     break
+            sleep(self.config.get("monitor_interval", 2.0))
 
     def cleanup_processes(self) -> None:
         """Clean up all running processes."""
-        telemetry_db_semaphore.release()
         for process in self.running_processes:
             process.kill()
         self.running_processes = []
@@ -367,6 +477,10 @@ def main() -> None:
     
     Initializes the application, starts all processes, and handles shutdown.
     """
+    # Children fork from a small preloaded server instead of this process
+    multiprocessing.set_start_method('forkserver', force=True)
+    multiprocessing.set_forkserver_preload(['numpy', 'sqlalchemy', 'psutil'])
+
     try:
         config = utils.load_config('app_config')
         logger = utils.get_logger()
@@ -12,23 +12,61 @@ Classes:
 
 import datetime as dt
 import os
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any, Union
+import threading
+from typing import List, Dict, Iterable, Optional, Tuple, Any, Union
 
 import constants as const
 import numpy as np
 import sqlalchemy
 import utils
+from utils.sqlite_pragmas import sqlite_pragma_listener
 from dotenv import load_dotenv
 from envs import env
 from ..miDatabase.models import Analyte, Event, Prediction
-from sqlalchemy import create_engine, text, update
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import and_, bindparam, create_engine, delete, exc, func, insert, select, text, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import SingletonThreadPool
 
 load_dotenv()
 
+# Applied on top of the shared pragmas; auto_vacuum only takes effect on a
+# new database or after a VACUUM
+_set_sqlite_pragmas = sqlite_pragma_listener('auto_vacuum=INCREMENTAL')
+
+
+def _record_connection_pid(_: Any, connection_record: Any) -> None:
+    """Remember which process opened a pooled connection.
+    
+    Args:
+        _: Raw sqlite3 connection (unused)
+        connection_record: Pool record owning the connection
+    """
+    connection_record.info['pid'] = os.getpid()
+
+
+def _check_connection_pid(_: Any, connection_record: Any, connection_proxy: Any) -> None:
+    """Refuse pooled connections inherited from a parent process.
+    
+    The worker processes are forked after the engine exists, so a pooled
+    connection can leak into a child. Raising DisconnectionError makes the
+    pool drop it and open a fresh one in the current process.
+    
+    Args:
+        _: Raw sqlite3 connection (unused)
+        connection_record: Pool record owning the connection
+        connection_proxy: Pool proxy handed to the caller
+    """
+    pid = os.getpid()
+    if connection_record.info['pid'] != pid:
+        connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+        raise exc.DisconnectionError(
+            f"Connection record belongs to pid {connection_record.info['pid']}, "
+            f"attempting to check out in pid {pid}"
+        )
+
 
 class Database:
     """Singleton database interface for managing analyte predictions and events.
@@ -38,24 +76,110 @@ class Database:
     methods for managing analyte predictions, events, and their associated data.
     
     Attributes:
-        _engine: SQLAlchemy engine instance for database connections
-        _Base: SQLAlchemy declarative base for table management
+        _engine: SQLAlchemy engine instance for database connections, built
+            with the first instance
         _Session: SQLAlchemy session factory
+        _write_lock: Serializes writes between the threads of a process
         __instance: Singleton instance of the Database class
     """
     
-    _engine = create_engine(
-        const.MI_DATABASE_NAME,
-        echo=False,
-        poolclass=NullPool,
-        connect_args={'timeout': 15}
-    )
-    _Base = declarative_base()
-    _Session = sessionmaker(bind=_engine)
-    __instance = None
+    # Free pages returned to the file system per cleanup
+    INCREMENTAL_VACUUM_PAGES = 1000
     
-    # Enable Write-Ahead Logging for better performance
-    sqlalchemy.event.listen(_engine, 'connect', lambda c, _: c.execute('pragma journal_mode=WAL'))
+    _engine: Optional[Engine] = None
+    _Session: Optional[sessionmaker] = None
+    __instance = None
+
+    # Threads of one process (the MI loop and its event engine) each have their
+    # own connection; taking turns here hands the write lock over directly
+    # instead of leaving SQLite's busy handler to sleep and retry
+    _write_lock = threading.Lock()
+
+    # Statements on the event engine hot path, built once so SQLAlchemy's
+    # compiled cache and the sqlite3 statement cache are reused on every call
+    _GET_PREDICTION_VALUE = select(Prediction.value).where(
+        Prediction.analyte_id == bindparam('analyte_id')
+    ).order_by(Prediction.date.desc()).limit(1)
+    _GET_EVENT_STATE = select(Event.last_state).where(
+        Event.event_name == bindparam('event_name')
+    ).limit(1)
+    _GET_LAST_PREDICTION_TIME = select(func.max(Prediction.date))
+    _GET_EVENT_NAMES = select(Event.event_name).order_by(Event.date.desc())
+    _GET_LATEST_EVENT = select(Event.event_name, Event.date).order_by(Event.date.desc()).limit(1)
+    _GET_ANALYTE_ID = select(Analyte.id).where(
+        Analyte.name == bindparam('name')
+    ).limit(1)
+    _GET_ANALYTE_IDS = select(Analyte.name, Analyte.id).where(
+        Analyte.name.in_(bindparam('names', expanding=True))
+    )
+    _INSERT_PREDICTION = insert(Prediction)
+    _UPDATE_SENT_MQTT = update(Prediction).where(
+        Prediction.id == bindparam('prediction_id')
+    ).values(sent_mqtt_payload=bindparam('mqtt_sent'))
+    # Executed with one parameter set per inference run
+    _MARK_RUN_SENT = update(Prediction).where(
+        Prediction.log_id == bindparam('b_log_id'),
+        Prediction.date == bindparam('b_date'),
+        Prediction.sent_mqtt_payload == False
+    ).values(sent_mqtt_payload=True)
+    _DELETE_SENT_PREDICTIONS = delete(Prediction).where(
+        Prediction.sent_mqtt_payload == True
+    ).execution_options(synchronize_session=False)
+    _MARK_SENT_MQTT = update(Prediction).where(
+        Prediction.id.in_(bindparam('prediction_ids', expanding=True))
+    ).values(sent_mqtt_payload=True)
+    _GET_UNSENT_PREDICTIONS = select(
+        Prediction.id,
+        Analyte.name,
+        Prediction.value,
+        Prediction.date
+    ).join(
+        Analyte,
+        Prediction.analyte_id == Analyte.id
+    ).where(
+        Prediction.sent_mqtt_payload == False
+    ).execution_options(yield_per=1000)
+    # Attributes bound to None keep their current value
+    _UPDATE_EVENT_ATTRIBUTES = update(Event).where(
+        Event.event_name == bindparam('b_event_name')
+    ).values(
+        last_state=func.coalesce(bindparam('b_state'), Event.last_state),
+        date=func.coalesce(bindparam('b_date'), Event.date),
+        value=func.coalesce(bindparam('b_value'), Event.value),
+        temp=func.coalesce(bindparam('b_temp'), Event.temp),
+        humidity=func.coalesce(bindparam('b_humidity'), Event.humidity)
+    )
+    # Executed with one parameter set per event
+    _UPDATE_EVENTS = update(Event.__table__).where(
+        Event.__table__.c.event_name == bindparam('b_event_name')
+    )
+
+
+    @classmethod
+    def _build_engine(cls) -> None:
+        """Create the engine and session factory on first use.
+        
+        Importing this module does not touch the database; the engine is only
+        built when the first instance is created.
+        """
+        if cls._engine is not None:
+            return
+        # One connection per thread, reused across calls instead of reopening the
+        # database file for every small query
+        cls._engine = create_engine(
+            const.MI_DATABASE_NAME,
+            echo=False,
+            poolclass=SingletonThreadPool,
+            pool_size=8,
+            query_cache_size=1200,
+            connect_args={'check_same_thread': False}
+        )
+        cls._Session = sessionmaker(bind=cls._engine)
+
+        # Enable Write-Ahead Logging and cache/mmap tuning for better performance
+        sqlalchemy.event.listen(cls._engine, 'connect', _set_sqlite_pragmas)
+        sqlalchemy.event.listen(cls._engine, 'connect', _record_connection_pid)
+        sqlalchemy.event.listen(cls._engine, 'checkout', _check_connection_pid)
 
     @classmethod
     def get_instance(cls) -> 'Database':
@@ -78,10 +202,18 @@ class Database:
             raise Exception("This class is a singleton!")
         
         Database.__instance = self
+        self._build_engine()
         self._config = utils.load_config()
+        self._analyte_ids: Dict[str, int] = {}
+        self._create_indexes()
         self.populate_supported_analytes()
         self.populate_events()
 
+    def _create_indexes(self) -> None:
+        """Create the prediction and event indexes if they don't exist yet."""
+        for index in (*Prediction.__table__.indexes, *Event.__table__.indexes):
+            index.create(bind=self._engine, checkfirst=True)
+
     def get_db_size(self) -> int:
         """Get the size of the database file in bytes.
         
@@ -93,27 +225,32 @@ class Database:
     def clean_mi_db(self) -> None:
         """Clean the database by removing sent MQTT predictions and optimizing the database.
         
-        This method removes all predictions that have been sent via MQTT and
-        performs database optimization using VACUUM.
+        This method removes all predictions that have been sent via MQTT,
+        returns up to INCREMENTAL_VACUUM_PAGES free pages to the file system
+        and truncates the WAL. Use compact() for a full rewrite of the file.
+        
+        A database created before auto_vacuum was set cannot be vacuumed
+        incrementally; the first cleanup converts it with a single compact().
         """
-        with self._Session() as session:
-            session.query(Prediction).filter(Prediction.sent_mqtt_payload == True).delete()
+        with self._write_lock, self._Session() as session:
+            session.execute(self._DELETE_SENT_PREDICTIONS)
             session.commit()
-            self._restructure_db(session)
+            incremental = session.execute(text("PRAGMA auto_vacuum;")).scalar() == 2  # 2 = INCREMENTAL
+            if incremental:
+                self._restructure_db(session)
+            session.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
+        if not incremental:
+            self.compact()
 
-    def _get_prediction_times(self, session: Session, limit: Optional[int] = None) -> Optional[List[datetime]]:
-        """Get prediction timestamps ordered by date.
+    def compact(self) -> None:
+        """Rebuild the whole database file with VACUUM.
         
-        Args:
-            session: SQLAlchemy session
-            limit: Maximum number of timestamps to return
-            
-        Returns:
-            Optional[List[datetime]]: List of prediction timestamps or None if no predictions exist
+        This holds an exclusive lock for the duration of the rewrite, so it is
+        meant for maintenance rather than the periodic cleanup. It also applies
+        the auto_vacuum setting to a database created before it was set.
         """
-        result = session.query(Prediction.date).order_by(
-            Prediction.date.desc()).limit(limit).all()
-        return result if result else None
+        with self._write_lock, self._engine.connect() as conn:
+            conn.execute(text("VACUUM;"))
 
     def _get_event_count(self, session: Session) -> int:
         """Get the total count of events in the database.
@@ -126,19 +263,6 @@ class Database:
         """
         return session.query(Event).count()
 
-    def _get_events(self, session: Session, limit: Optional[int] = None) -> List[Event]:
-        """Get events ordered by date.
-        
-        Args:
-            session: SQLAlchemy session
-            limit: Maximum number of events to return
-            
-        Returns:
-            List[Event]: List of event objects
-        """
-        return session.query(Event).order_by(
-            Event.date.desc()).limit(limit).all()
-
     def get_event_state(self, event_name: str) -> Optional[str]:
         """Get the current state of an event.
         
@@ -149,9 +273,8 @@ class Database:
             Optional[str]: Current state of the event or None if event not found
         """
         with self._Session() as session:
-            events = session.query(Event).where(
-                Event.event_name == event_name).all()
-        return events[0].last_state if events else None
+            return session.execute(
+                self._GET_EVENT_STATE, {'event_name': event_name}).scalar()
 
     def get_event_details(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get detailed information about events.
@@ -194,55 +317,21 @@ class Database:
             temp: New temperature value
             humidity: New humidity value
         """
-        kwargs = {}
-        if state:
-            kwargs['last_state'] = state
-        if date:
-            kwargs['date'] = date
-        if value is not None and value > -1:
-            kwargs['value'] = value
-        if temp is not None and temp > -1:
-            kwargs['temp'] = temp
-        if humidity is not None and humidity > -1:
-            kwargs['humidity'] = humidity
-            
-        query = update(Event).where(
-            Event.event_name == event_name).values(**kwargs)
-        session.execute(query)
-
-    def _add_event(
-        self,
-        session: Session,
-        event_name: str,
-        state: str,
-        date: datetime,
-        value: Optional[float] = None,
-        temp: Optional[float] = None,
-        humidity: Optional[float] = None
-    ) -> None:
-        """Add a new event to the database.
-        
-        Args:
-            session: SQLAlchemy session
-            event_name: Name of the event
-            state: Initial state of the event
-            date: Date of the event
-            value: Value associated with the event
-            temp: Temperature value
-            humidity: Humidity value
-        """
-        session.add(Event(
-            event_name=event_name,
-            last_state=state,
-            date=date,
-            value=value,
-            temp=temp,
-            humidity=humidity
-        ))
+        session.execute(self._UPDATE_EVENT_ATTRIBUTES, {
+            'b_event_name': event_name,
+            'b_state': state or None,
+            'b_date': date or None,
+            'b_value': value if value is not None and value > -1 else None,
+            'b_temp': temp if temp is not None and temp > -1 else None,
+            'b_humidity': humidity if humidity is not None and humidity > -1 else None
+        })
 
     def populate_supported_analytes(self) -> bool:
         """Populate the database with supported analytes.
         
+        The analyte IDs are cached either way, since they never change once
+        the analytes exist.
+        
         Returns:
             bool: True if analytes were populated, False otherwise
         """
@@ -256,6 +345,8 @@ class Database:
                 return True
             except Exception:
                 return False
+            finally:
+                self._cache_analyte_ids(session)
 
     def get_supported_analytes(self) -> List[Analyte]:
         """Get all supported analytes from the database.
@@ -264,7 +355,9 @@ class Database:
             List[Analyte]: List of analyte objects
         """
         with self._Session() as session:
-            return session.query(Analyte).all()
+            analytes = session.query(Analyte).all()
+        self._analyte_ids.update((analyte.name, analyte.id) for analyte in analytes)
+        return analytes
 
     def save_prediction(self, last_log_id: int, results: Dict[str, float], date: datetime) -> bool:
         """Save prediction results to the database.
@@ -277,15 +370,12 @@ class Database:
         Returns:
             bool: True if predictions were saved successfully, False otherwise
         """
-        with self._Session() as session:
+        with self._write_lock, self._Session() as session:
             try:
                 if not results:
                     return False
                     
-                for analyte_name, result in results.items():
-                    analyte_id = self._get_analyte_id(session, analyte_name)
-                    if analyte_id is not None:
-                        self._add_prediction(session, last_log_id, analyte_id, result, date)
+                self._add_predictions(session, last_log_id, results, date)
                 session.commit()
                 return True
             except Exception as e:
@@ -296,6 +386,9 @@ class Database:
     def get_prediction_value(self, analyte_name: str) -> Optional[float]:
         """Get the most recent prediction value for an analyte.
         
+        The analyte ID comes from the cache, so no join with the analyte table
+        is needed and the (analyte_id, date) index serves the whole query.
+        
         Args:
             analyte_name: Name of the analyte
             
@@ -303,8 +396,11 @@ class Database:
             Optional[float]: Most recent prediction value or None if no predictions exist
         """
         with self._Session() as session:
-            predictions = self._get_predictions(session, analyte_name=analyte_name, limit=1)
-        return predictions[0].value if predictions else None
+            analyte_id = self._get_analyte_id(session, analyte_name)
+            if analyte_id is None:
+                return None
+            return session.execute(
+                self._GET_PREDICTION_VALUE, {'analyte_id': analyte_id}).scalar()
 
     def get_last_prediction_time(self) -> Optional[datetime]:
         """Get the timestamp of the most recent prediction.
@@ -313,8 +409,7 @@ class Database:
             Optional[datetime]: Timestamp of the most recent prediction or None if no predictions exist
         """
         with self._Session() as session:
-            prediction_time = self._get_prediction_times(session, 1)
-            return prediction_time[0].date if prediction_time else None
+            return session.execute(self._GET_LAST_PREDICTION_TIME).scalar()
 
     def populate_events(self) -> bool:
         """Populate the database with supported event types.
@@ -323,60 +418,38 @@ class Database:
             bool: True if events were populated successfully, False otherwise
         """
         supported_event_types = self._config['event_config']['supported_event_types']
+        default_state = self._config['event_config']['default_state']
+        current_datetime = dt.datetime.now()
+
+        event_names = []
+        for event_type in supported_event_types:
+            if event_type == 'analyte_based':
+                event_names.extend(self._config['supported_analytes'])
+            elif event_type == 'tobacco':
+                event_names.append('tobacco')
+        rows = [
+            {
+                'event_name': event_name,
+                'last_state': default_state,
+                'date': current_datetime,
+                'value': 0.0,
+                'temp': 0.0,
+                'humidity': 0.0
+            }
+            for event_name in event_names
+        ]
+
         try:
             with self._Session() as session:
-                if self._get_event_count(session) != 0:
+                if self._get_event_count(session) != 0 or not rows:
                     return False
                     
-                for event_type in supported_event_types:
-                    if event_type == 'analyte_based':
-                        self._populate_analyte_events(session)
-                    elif event_type == 'tobacco':
-                        self._populate_tobacco_event(session)
+                session.execute(insert(Event), rows)
                 session.commit()
             return True
         except Exception:
             return False
 
-    def _populate_analyte_events(self, session: Session) -> None:
-        """Populate events for supported analytes.
-        
-        Args:
-            session: SQLAlchemy session
-        """
-        supported_analytes = self._config['supported_analytes']
-        default_state = self._config['event_config']['default_state']
-        current_datetime = dt.datetime.now()
-        
-        for analyte_name in supported_analytes:
-            self._add_event(
-                session,
-                analyte_name,
-                default_state,
-                current_datetime,
-                0.0,
-                0.0,
-                0.0
-            )
-
-    def _populate_tobacco_event(self, session: Session) -> None:
-        """Populate the tobacco event.
-        
-        Args:
-            session: SQLAlchemy session
-        """
-        current_datetime = dt.datetime.now()
-        default_state = self._config['event_config']['default_state']
-        self._add_event(
-            session,
-            'tobacco',
-            default_state,
-            current_datetime,
-            0.0,
-            0.0,
-            0.0
-        )
-
     def is_analyte_event(self, event_name: str) -> bool:
         """Check if an event is analyte-based.
         
@@ -420,10 +493,8 @@ class Database:
             Optional[Tuple[str, datetime]]: Tuple of (event_name, date) or None if no events exist
         """
         with self._Session() as session:
-            latest_event = self._get_events(session, 1)
-            if not latest_event:
-                return None
-            return latest_event[0].event_name, latest_event[0].date
+            latest_event = session.execute(self._GET_LATEST_EVENT).first()
+        return tuple(latest_event) if latest_event else None
 
     def get_event_names(self) -> List[str]:
         """Get all event names from the database.
@@ -432,8 +503,7 @@ class Database:
             List[str]: List of event names
         """
         with self._Session() as session:
-            events = self._get_events(session)
-            return [event.event_name for event in events]
+            return session.execute(self._GET_EVENT_NAMES).scalars().all()
 
     def update_event(
         self,
@@ -457,7 +527,7 @@ class Database:
         Returns:
             bool: True if update was successful, False otherwise
         """
-        with self._Session() as session:
+        with self._write_lock, self._Session() as session:
             try:
                 if self.is_supported_state(state=state):
                     self._update_event_attributes(
@@ -475,9 +545,121 @@ class Database:
                 session.rollback()
                 return False
 
+    def get_latest_prediction_ids(self) -> Dict[str, int]:
+        """Get the ID of the most recent prediction stored for each analyte.
+        
+        Prediction IDs only grow, so a changed ID means a new prediction arrived.
+        
+        Returns:
+            Dict[str, int]: Mapping of analyte name to its latest prediction ID
+        """
+        with self._Session() as session:
+            rows = session.query(
+                Analyte.name,
+                func.max(Prediction.id)
+            ).join(
+                Prediction,
+                Prediction.analyte_id == Analyte.id
+            ).group_by(Analyte.name).all()
+        return {name: prediction_id for name, prediction_id in rows}
+
+    def get_analyte_event_bundle(
+        self,
+        analytes: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, str, str, float]]:
+        """Get every analyte event together with its latest prediction in one query.
+        
+        Analyte-based events share their name with the associated analyte, so the
+        event table is joined on the analyte name and on the most recent prediction
+        of that analyte. Events without any prediction are not returned.
+        
+        Args:
+            analytes: Optional subset of the supported analytes to fetch
+        
+        Returns:
+            List[Tuple[str, str, str, float]]: List of
+                (event_name, analyte, last_state, prediction_value) tuples
+        """
+        with self._Session() as session:
+            latest = session.query(
+                Prediction.analyte_id,
+                func.max(Prediction.date).label('date')
+            ).group_by(Prediction.analyte_id).subquery()
+
+            rows = session.query(
+                Event.event_name,
+                Analyte.name,
+                Event.last_state,
+                Prediction.value
+            ).join(
+                Analyte,
+                Analyte.name == Event.event_name
+            ).join(
+                Prediction,
+                Prediction.analyte_id == Analyte.id
+            ).join(
+                latest,
+                and_(
+                    Prediction.analyte_id == latest.c.analyte_id,
+                    Prediction.date == latest.c.date
+                )
+            ).filter(
+                Event.event_name.in_(self._config['supported_analytes'])
+            )
+            if analytes is not None:
+                rows = rows.filter(Event.event_name.in_(list(analytes)))
+            rows = rows.all()
+        return [tuple(row) for row in rows]
+
+    def update_events(self, events: List[Dict[str, Any]]) -> bool:
+        """Update several events in a single transaction.
+        
+        Args:
+            events: List of dictionaries with the keys event_name, state, value,
+                date, temp and humidity
+                
+        Returns:
+            bool: True if update was successful, False otherwise
+        """
+        rows = [
+            {
+                'b_event_name': event['event_name'],
+                'last_state': event['state'],
+                'value': event['value'],
+                'date': event['date'],
+                'temp': event['temp'],
+                'humidity': event['humidity']
+            }
+            for event in events if self.is_supported_state(state=event['state'])
+        ]
+        if not rows:
+            return False
+
+        with self._write_lock, self._Session() as session:
+            try:
+                session.execute(self._UPDATE_EVENTS, rows)
+                session.commit()
+                return True
+            except Exception:
+                session.rollback()
+                return False
+
+    def _cache_analyte_ids(self, session: Session) -> None:
+        """Load the IDs of every analyte into the in-process cache.
+        
+        Args:
+            session: SQLAlchemy session
+        """
+        try:
+            self._analyte_ids.update(session.query(Analyte.name, Analyte.id).all())
+        except exc.SQLAlchemyError:
+            session.rollback()  # Looked up lazily instead
+
     def _get_analyte_id(self, session: Session, name: str) -> Optional[int]:
         """Get the ID of an analyte by name.
         
+        The database is only queried when the analyte is not cached yet.
+        
         Args:
             session: SQLAlchemy session
             name: Name of the analyte
@@ -485,8 +667,12 @@ class Database:
         Returns:
             Optional[int]: ID of the analyte or None if not found
         """
-        analyte_obj = session.query(Analyte).filter(Analyte.name == name).first()
-        return analyte_obj.id if analyte_obj else None
+        analyte_id = self._analyte_ids.get(name)
+        if analyte_id is None:
+            analyte_id = session.execute(self._GET_ANALYTE_ID, {'name': name}).scalar()
+            if analyte_id is not None:
+                self._analyte_ids[name] = analyte_id
+        return analyte_id
 
     def _add_analytes(self, session: Session, analytes: List[str]) -> None:
         """Add multiple analytes to the database.
@@ -498,85 +684,71 @@ class Database:
         objects = [Analyte(name=analyte_name) for analyte_name in analytes]
         session.add_all(objects)
 
-    def _add_prediction(
-        self,
-        session: Session,
-        last_log_id: int,
-        analyte_id: int,
-        value: float,
-        date: datetime
-    ) -> None:
-        """Add a prediction to the database.
+    def _get_analyte_ids(self, session: Session, names: Iterable[str]) -> Dict[str, int]:
+        """Get the IDs of several analytes, querying only the ones not cached yet.
         
         Args:
             session: SQLAlchemy session
-            last_log_id: ID of the last log entry
-            analyte_id: ID of the analyte
-            value: Predicted value
-            date: Date of the prediction
+            names: Names of the analytes
+            
+        Returns:
+            Dict[str, int]: Mapping of analyte name to ID, for the analytes found
         """
-        session.add(Prediction(
-            log_id=last_log_id,
-            analyte_id=analyte_id,
-            value=value,
-            date=date,
-            sent_mqtt_payload=False
-        ))
+        missing = [name for name in names if name not in self._analyte_ids]
+        if missing:
+            self._analyte_ids.update(session.execute(self._GET_ANALYTE_IDS, {'names': missing}).all())
+        return self._analyte_ids
 
-    def _get_predictions(
+    def _add_predictions(
         self,
         session: Session,
-        analyte_name: str,
-        limit: Optional[int] = None
-    ) -> List[Prediction]:
-        """Get predictions for an analyte.
+        last_log_id: int,
+        results: Dict[str, float],
+        date: datetime
+    ) -> None:
+        """Add the predictions of one inference run with a single executemany.
+        
+        Predictions for unknown analytes are skipped.
         
         Args:
             session: SQLAlchemy session
-            analyte_name: Name of the analyte
-            limit: Maximum number of predictions to return
-            
-        Returns:
-            List[Prediction]: List of prediction objects
+            last_log_id: ID of the last log entry
+            results: Dictionary mapping analyte names to their predicted values
+            date: Date of the prediction
         """
-        query = session.query(Prediction.value)\
-            .join(Prediction.analyte)\
-            .order_by(Prediction.date.desc())\
-            .where(Analyte.name == analyte_name)\
-            .limit(limit)
-        return query.all()
+        analyte_ids = self._get_analyte_ids(session, results)
+        rows = [
+            {
+                'log_id': last_log_id,
+                'analyte_id': analyte_ids[analyte_name],
+                'value': value,
+                'date': date,
+                'sent_mqtt_payload': False
+            }
+            for analyte_name, value in results.items() if analyte_name in analyte_ids
+        ]
+        if rows:
+            session.execute(self._INSERT_PREDICTION, rows)
 
     def get_unsent_mqtt_predictions(self) -> Dict[str, Any]:
         """Get predictions that haven't been sent via MQTT.
         
         Returns:
-            Dict[str, Any]: Dictionary containing prediction IDs and logs
+            Dict[str, Any]: Dictionary containing prediction IDs, logs keyed by
+            prediction date, and the prediction IDs of each date
         """
-        with self._Session() as session:
-            results = session.query(
-                Prediction.id,
-                Analyte.name,
-                Prediction.value,
-                Prediction.date
-            ).join(
-                Analyte,
-                Prediction.analyte_id == Analyte.id
-            ).filter(
-                Prediction.sent_mqtt_payload == False
-            ).all()
-            
-        prediction_logs = {}
+        prediction_logs = defaultdict(dict)
         prediction_ids = []
+        ids_by_date = defaultdict(list)
         
-        for result in results:
-            result_dict = result._asdict()
-            current_date = result_dict["date"]
-            prediction_ids.append(result_dict["id"])
-            current_log = prediction_logs.get(current_date, {})
-            current_log[result_dict["name"]] = result_dict["value"]
-            prediction_logs[current_date] = current_log
+        # Rows are streamed in batches rather than fetched all at once
+        with self._Session() as session:
+            for prediction_id, name, value, date in session.execute(self._GET_UNSENT_PREDICTIONS):
+                prediction_ids.append(prediction_id)
+                ids_by_date[date].append(prediction_id)
+                prediction_logs[date][name] = value
             
-        return {"ids": prediction_ids, "logs": prediction_logs}
+        return {"ids": prediction_ids, "logs": dict(prediction_logs), "ids_by_date": dict(ids_by_date)}
 
     def update_sent_mqtt_predictions(self, prediction_id: int, mqtt_sent: bool) -> None:
         """Update the MQTT sent status of a prediction.
@@ -585,18 +757,51 @@ class Database:
             prediction_id: ID of the prediction to update
             mqtt_sent: New MQTT sent status
         """
-        with self._Session() as session:
-            query = update(Prediction).where(
-                Prediction.id == prediction_id
-            ).values(sent_mqtt_payload=mqtt_sent)
-            session.execute(query)
+        with self._write_lock, self._Session() as session:
+            session.execute(self._UPDATE_SENT_MQTT, {
+                'prediction_id': prediction_id,
+                'mqtt_sent': mqtt_sent
+            })
+            session.commit()
+
+    def update_sent_mqtt_predictions_bulk(self, prediction_ids: List[int]) -> None:
+        """Mark several predictions as sent with a single UPDATE.
+        
+        Args:
+            prediction_ids: IDs of the predictions to mark as sent
+        """
+        if not prediction_ids:
+            return
+        with self._write_lock, self._Session() as session:
+            session.execute(self._MARK_SENT_MQTT, {'prediction_ids': prediction_ids})
+            session.commit()
+
+    def mark_predictions_sent(self, runs: List[Tuple[int, datetime]]) -> None:
+        """Mark the predictions of the given inference runs as sent.
+        
+        A run is identified by its telemetry log ID and prediction date, so
+        other runs on the same log that were never published stay unsent.
+        
+        Args:
+            runs: (log_id, date) of each published inference run
+        """
+        if not runs:
+            return
+        with self._write_lock, self._Session() as session:
+            session.execute(self._MARK_RUN_SENT, [
+                {'b_log_id': log_id, 'b_date': date} for log_id, date in runs
+            ])
             session.commit()
 
     def _restructure_db(self, session: Session) -> None:
-        """Optimize the database using VACUUM.
+        """Shrink the database file with a bounded incremental vacuum.
+        
+        Unlike VACUUM this does not rewrite the whole file, so writers are only
+        held up while the freed pages are truncated.
         
         Args:
             session: SQLAlchemy session
         """
-        with session.connection() as conn:
-            conn.execute(text("VACUUM;"))
+        # Run as a script: sqlite3's execute() steps the pragma once, freeing a single page
+        session.connection().connection.executescript(
+            f"PRAGMA incremental_vacuum({self.INCREMENTAL_VACUUM_PAGES});")
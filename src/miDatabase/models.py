@@ -11,7 +11,7 @@ Classes:
 """
 
 import constants as const
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -136,3 +136,24 @@ class Event(Base):
         self.value = value
         self.temp = temp
         self.humidity = humidity
+
+
+# Indexes backing the event engine lookups (latest prediction per analyte,
+# events by state and date)
+Index('idx_prediction_analyte_date', Prediction.analyte_id, Prediction.date.desc())
+Index('idx_event_state_date', Event.last_state, Event.date)
+
+# Partial index over unsent predictions only, so it stays small however large
+# the sent backlog grows; keyed on (log_id, date) for marking an inference run
+# sent. SQLite only uses it for queries that repeat the sent_mqtt_payload = 0
+# predicate.
+Index(
+    'idx_prediction_unsent_run',
+    Prediction.log_id,
+    Prediction.date,
+    sqlite_where=Prediction.sent_mqtt_payload == False
+)
+# Latest prediction time across all analytes
+Index('idx_prediction_date', Prediction.date)
+# Events ordered by most recent, for the UI event list
+Index('idx_event_date', Event.date.desc())
@@ -10,11 +10,13 @@ Classes:
     DataQueue: Thread-safe FIFO queue for sensor data
     PayloadProcessor: Processes raw sensor data into structured format
     SerialCommunicator: Handles serial communication with the sensor
+    SamplePool: Free list of reusable sample buffers
 """
 
 from .sensor_interface import SensorInterface
 from .data_queue import DataQueue
 from .payload_processor import PayloadProcessor
 from .serial_communicator import SerialCommunicator
+from .sample_pool import SamplePool
 
-__all__ = ['SensorInterface', 'DataQueue', 'PayloadProcessor', 'SerialCommunicator'] 
\ No newline at end of file
+__all__ = ['SensorInterface', 'DataQueue', 'PayloadProcessor', 'SerialCommunicator', 'SamplePool'] 
\ No newline at end of file
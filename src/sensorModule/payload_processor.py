@@ -6,7 +6,7 @@ including timestamp addition and data validation.
 """
 
 import time
-from typing import List, Any
+from typing import List, Any, Optional
 import constants as const
 
 
@@ -20,18 +20,23 @@ class PayloadProcessor:
     - Data validation
     
     Attributes:
-        _separator (str): The separator used in the payload
+        _separator (bytes): The separator used in the payload
     """
     
     def __init__(self):
         """Initialize the payload processor."""
-        self._separator = const.VALUE_SEPARATOR
+        self._separator = const.VALUE_SEPARATOR_B
 
-    def process_payload(self, payload: str) -> List[Any]:
+    def process_payload(self, payload: bytes, out: Optional[List[Any]] = None) -> List[Any]:
         """Process a raw payload into structured data.
         
+        Telemetry values are left as bytes (float() accepts them directly);
+        only the BFU device ID is decoded to a string.
+        
         Args:
-            payload (str): Raw payload string to process
+            payload (bytes): Raw payload read from the serial port
+            out (Optional[List[Any]]): Buffer to fill in place, e.g. one taken
+                from a SamplePool; a new list is used if omitted
             
         Returns:
             List[Any]: Processed data with timestamp
@@ -46,41 +51,44 @@ class PayloadProcessor:
         payload = self._remove_separator(payload)
         
         # Split the values
-        values = self._split_values(payload)
+        values = out if out is not None else []
+        values[:] = self._split_values(payload)
+        if len(values) >= const.BFU_DEVICE_ID_INDEX:
+            values[const.BFU_DEVICE_ID_INDEX - 1] = values[const.BFU_DEVICE_ID_INDEX - 1].decode("ascii")
         
         # Add timestamp
         return self._add_timestamp(values)
 
-    def _remove_separator(self, payload: str) -> str:
+    def _remove_separator(self, payload: bytes) -> bytes:
         """Remove the payload separator from the end of the payload.
         
         Args:
-            payload (str): Raw payload string
+            payload (bytes): Raw payload
             
         Returns:
-            str: Payload without the separator
+            bytes: Payload without the separator
         """
-        index = payload.rfind(const.PAYLOAD_SEPARATOR)
+        index = payload.rfind(const.PAYLOAD_SEPARATOR_B)
         if index == -1:
             return payload
         return payload[:index]
 
-    def _split_values(self, payload: str) -> List[str]:
+    def _split_values(self, payload: bytes) -> List[bytes]:
         """Split the payload into individual values.
         
         Args:
-            payload (str): Payload string to split
+            payload (bytes): Payload to split
             
         Returns:
-            List[str]: List of individual values
+            List[bytes]: List of individual values
         """
         return payload.split(self._separator, maxsplit=-1)
 
-    def _add_timestamp(self, values: List[str]) -> List[Any]:
+    def _add_timestamp(self, values: List[Any]) -> List[Any]:
         """Add ISO format timestamp to the values.
         
         Args:
-            values (List[str]): List of sensor values
+            values (List[Any]): List of sensor values
             
         Returns:
             List[Any]: Values with timestamp appended
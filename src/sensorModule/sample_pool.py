@@ -0,0 +1,54 @@
+"""
+Pool of reusable sample buffers.
+
+This module provides a small free list of sample containers so the collection
+thread can fill a recycled buffer instead of allocating a new one per sample.
+"""
+
+from collections import deque
+from typing import Any, List
+
+
+class SamplePool:
+    """Free list of reusable sample buffers.
+
+    Buffers are plain lists, filled in place by the payload processor and
+    handed back once the sample has been stored. When the pool is empty a new
+    buffer is allocated; buffers released beyond the pool's capacity are
+    dropped, so the pool never grows past its initial size.
+
+    deque.append and deque.pop are atomic, so the collection thread and the
+    consumer can share a pool without a lock.
+
+    Attributes:
+        _free (deque): Buffers ready for reuse
+    """
+
+    def __init__(self, size: int):
+        """Initialize the pool with pre-allocated buffers.
+
+        Args:
+            size (int): Number of buffers to keep
+        """
+        self._free = deque(([] for _ in range(size)), maxlen=size)
+
+    def acquire(self) -> List[Any]:
+        """Get an empty buffer from the pool.
+
+        Returns:
+            List[Any]: A recycled buffer, or a new one if the pool is empty
+        """
+        try:
+            return self._free.pop()
+        except IndexError:
+            return []
+
+    def release(self, buffer: List[Any]) -> None:
+        """Return a buffer to the pool.
+
+        Args:
+            buffer (List[Any]): Buffer that is no longer referenced
+        """
+        buffer.clear()
+        if len(self._free) < self._free.maxlen:
+            self._free.append(buffer)
@@ -20,6 +20,7 @@ import logging
 
 from .data_queue import DataQueue
 from .payload_processor import PayloadProcessor
+from .sample_pool import SamplePool
 from .serial_communicator import SerialCommunicator
 import constants as const
 
@@ -31,11 +32,12 @@ class SensorInterface:
     and provides methods to control the collection and access the collected data.
     
     Attributes:
-        _end_of_payload (bytes): End of payload marker in ASCII
+        _end_of_payload (bytes): End of payload marker
         _nb_of_value_separators (int): Number of telemetry values expected
         _collection_enabled (bool): Flag to control data collection
         _thread_active (bool): Flag to control the background thread
         _buffer_size (int): Size of the internal buffer for data collection
+        _pool (SamplePool): Reusable sample buffers
         _logger (logging.Logger): Logger instance for error reporting
     """
     
@@ -47,16 +49,17 @@ class SensorInterface:
             baud_rate (int): Baud rate for serial communication
             buffer_size (int): Maximum number of samples to store in the queue
         """
-        self._end_of_payload = bytes(const.END_OF_PAYLOAD, "ascii")
+        self._end_of_payload = const.END_OF_PAYLOAD_B
         self._nb_of_value_separators = const.NB_OF_TELEMETRY_VALUES
         self._collection_enabled = True
         self._thread_active = True
         self._buffer_size = buffer_size
         self._logger = logging.getLogger(__name__)
         
-        self._serial = SerialCommunicator(port, baud_rate)
+        self._serial = SerialCommunicator(port, baud_rate, read_timeout=const.SERIAL_READ_TIMEOUT)
         self._processor = PayloadProcessor()
         self._queue = DataQueue()
+        self._pool = SamplePool(2 * const.SENSOR_WRITE_BATCH_SIZE)
         self._collection_thread = threading.Thread(target=self._collection_loop)
         self._collection_thread.daemon = True
         self._collection_thread.start()
@@ -76,6 +79,18 @@ class SensorInterface:
         except Empty:
             return None
 
+    def release_samples(self, samples: List[List[Any]]) -> None:
+        """Hand samples back for reuse once they have been stored.
+        
+        The samples must not be used after this call.
+        
+        Args:
+            samples (List[List[Any]]): Samples returned by get_sample
+        """
+        for sample in samples:
+            if sample is not None:
+                self._pool.release(sample)
+
     def is_sample_available(self) -> bool:
         """Check if there are samples available in the queue.
         
@@ -117,29 +132,28 @@ class SensorInterface:
         self._serial.close()
         self._logger.info("Sensor interface shutdown complete")
 
-    def _is_payload_complete(self, payload: str) -> bool:
+    def _is_payload_complete(self, payload: bytes) -> bool:
         """Check if a payload is complete based on separator count.
         
         Args:
-            payload (str): Raw payload to check
+            payload (bytes): Raw payload to check
             
         Returns:
             bool: True if payload is complete, False otherwise
         """
-        return payload.count(const.VALUE_SEPARATOR) == self._nb_of_value_separators
+        return payload.count(const.VALUE_SEPARATOR_B) == self._nb_of_value_separators
 
     def _process_payload(self) -> None:
-        """Process a single payload from the serial connection."""
-        if not self._serial.is_data_available():
-            return
-            
-        payload = self._serial.read_until(self._end_of_payload)
+        """Wait for and process a single payload from the serial connection."""
+        payload = self._serial.read_frame(self._end_of_payload)
         if payload and self._is_payload_complete(payload):
+            if self._queue.size() >= self._buffer_size:
+                return
+            buffer = self._pool.acquire()
             try:
-                processed_data = self._processor.process_payload(payload)
-                if self._queue.size() < self._buffer_size:
-                    self._queue.put(processed_data)
+                self._queue.put(self._processor.process_payload(payload, buffer))
             except ValueError as e:
+                self._pool.release(buffer)
                 self._logger.error(f"Error processing payload: {e}")
 
     def _collection_loop(self) -> None:
@@ -149,8 +163,8 @@ class SensorInterface:
                 sleep(0.1)  # Reduce CPU usage when collection is disabled
                 continue
                 
+            # Blocks on the serial port for up to SERIAL_READ_TIMEOUT
             self._process_payload()
-            sleep(const.SERIAL_COLLECT_INTERVAL)
 
     def __enter__(self):
         """Context manager entry."""
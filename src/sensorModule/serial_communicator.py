@@ -23,23 +23,28 @@ class SerialCommunicator:
     Attributes:
         _port (str): Serial port to connect to
         _baud_rate (int): Baud rate for communication
+        _read_timeout (Optional[float]): Read timeout in seconds, None to block indefinitely
         _serial (serial.Serial): Serial connection object
+        _pending (bytearray): Partial frame carried over from a timed out read
         _logger (logging.Logger): Logger instance for error reporting
     """
     
-    def __init__(self, port: str, baud_rate: int):
+    def __init__(self, port: str, baud_rate: int, read_timeout: Optional[float] = None):
         """Initialize the serial communicator.
         
         Args:
             port (str): Serial port to connect to
             baud_rate (int): Baud rate for communication
+            read_timeout (Optional[float]): Read timeout in seconds, None to block indefinitely
             
         Raises:
             SerialException: If connection fails
         """
         self._port = port
         self._baud_rate = baud_rate
+        self._read_timeout = read_timeout
         self._serial = None
+        self._pending = bytearray()
         self._logger = logging.getLogger(__name__)
         self._connect()
 
@@ -53,7 +58,7 @@ class SerialCommunicator:
             self._serial = serial.Serial(
                 port=self._port,
                 baudrate=self._baud_rate,
-                timeout=None,
+                timeout=self._read_timeout,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
@@ -82,14 +87,14 @@ class SerialCommunicator:
             self._reconnect()
             return False
 
-    def read_until(self, terminator: bytes) -> Optional[str]:
+    def read_until(self, terminator: bytes) -> Optional[bytes]:
         """Read data until terminator is found.
         
         Args:
             terminator (bytes): Bytes to read until
             
         Returns:
-            Optional[str]: Read data or None if no data available
+            Optional[bytes]: Raw data including the terminator or None if no data available
             
         Raises:
             SerialException: If connection is lost
@@ -98,13 +103,43 @@ class SerialCommunicator:
             return None
             
         try:
-            data = str(self._serial.read_until(terminator))
-            return data.replace("b'", "")  # Remove b' added by serial comm
+            return self._serial.read_until(terminator)
         except SerialException:
             self._logger.warning("Connection lost while reading, attempting to reconnect")
             self._reconnect()
             return None
 
+    def read_frame(self, terminator: bytes) -> Optional[bytes]:
+        """Block until a complete frame has been read or the read timeout expires.
+        
+        Unlike read_until, this does not poll in_waiting first: pyserial waits on
+        the port's file descriptor with select, so the caller sleeps in the
+        kernel until bytes arrive. Bytes read before a timeout are kept and
+        completed by the next call.
+        
+        Args:
+            terminator (bytes): Bytes that end a frame
+            
+        Returns:
+            Optional[bytes]: Raw frame including the terminator or None if the
+                read timed out before the frame was complete
+        """
+        try:
+            chunk = self._serial.read_until(terminator)
+        except SerialException:
+            self._logger.warning("Connection lost while reading, attempting to reconnect")
+            self._reconnect()
+            return None
+
+        if not chunk:
+            return None
+        self._pending.extend(chunk)
+        if not self._pending.endswith(terminator):
+            return None
+        frame = bytes(self._pending)
+        self._pending.clear()
+        return frame
+
     def read(self) -> Optional[bytes]:
         """Read a single byte.
         
@@ -143,6 +178,7 @@ class SerialCommunicator:
             SerialException: If reconnection fails
         """
         self.close()
+        self._pending.clear()
         self._connect()
 
     def close(self) -> None:
@@ -19,9 +19,11 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
 import constants as const
-from sqlalchemy import create_engine, event, text, update
+import numpy as np
+from sqlalchemy import create_engine, event, select, text, update
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
+from utils.sqlite_pragmas import sqlite_pragma_listener
 from .models import Base, Telemetry, TelemetryLog, TelemetryType
 
 
@@ -56,14 +58,21 @@ class Database:
             self._engine = create_engine(
                 const.TELEMETRY_DATABASE_NAME,
                 echo=False,
-                poolclass=NullPool,
-                connect_args={'timeout': 15}
+                poolclass=NullPool
             )
-            # Enable Write-Ahead Logging for better performance
-            event.listen(self._engine, 'connect', lambda c, _: c.execute('pragma journal_mode=WAL'))
+            # Enable Write-Ahead Logging and mmap I/O for better performance
+            event.listen(self._engine, 'connect', sqlite_pragma_listener())
             self._Session = sessionmaker(bind=self._engine)
             self._initialized = True
 
+    def __reduce__(self):
+        """Pickle as a reference to the singleton.
+        
+        Child processes started with forkserver receive the instance pickled;
+        they rebuild their own engine instead of copying the parent's.
+        """
+        return (Database, ())
+
     @classmethod
     def get_instance(cls) -> 'Database':
         """Get the singleton instance of TelemetryDatabase.
@@ -367,28 +376,45 @@ class Database:
         """
         if payload is None:
             return
-            
+        self.write_many((payload,))
+
+    def write_many(self, payloads: List[List[Any]]) -> None:
+        """Write a batch of telemetry samples in a single transaction.
+        
+        The logs are inserted first to get their IDs, then all telemetry values
+        of the batch go in with one executemany and a single commit.
+        
+        Args:
+            payloads: Samples, each a list containing telemetry values and metadata
+        """
+        payloads = [payload for payload in payloads if payload is not None]
+        if not payloads:
+            return
+
         with self._Session() as session:
             try:
-                # Add telemetry log
-                log = TelemetryLog(
-                    created_at=payload[const.CREATED_AT_INDEX-1],
-                    bfu_device_id=payload[const.BFU_DEVICE_ID_INDEX-1],
-                    sent_mqtt_payload=False
-                )
-                session.add(log)
-                session.flush()  # Get the log ID
+                # Add telemetry logs
+                logs = [
+                    TelemetryLog(
+                        created_at=payload[const.CREATED_AT_INDEX-1],
+                        bfu_device_id=payload[const.BFU_DEVICE_ID_INDEX-1],
+                        sent_mqtt_payload=False
+                    )
+                    for payload in payloads
+                ]
+                session.add_all(logs)
+                session.flush()  # Get the log IDs
                 
                 # Add telemetry values in bulk
-                telemetry_values = [
-                    Telemetry(
-                        telemetry_log_id=log.id,
-                        telemetry_type_id=i+1,
-                        value=float(payload[i])
-                    )
+                session.bulk_insert_mappings(Telemetry, [
+                    {
+                        'telemetry_log_id': log.id,
+                        'telemetry_type_id': i+1,
+                        'value': float(payload[i])
+                    }
+                    for log, payload in zip(logs, payloads)
                     for i in range(const.NB_OF_TELEMETRY_VALUES)
-                ]
-                session.bulk_save_objects(telemetry_values)
+                ])
                 session.commit()
             except Exception as e:
                 session.rollback()
@@ -405,14 +431,19 @@ class Database:
         """
         self.update_sent_mqtt_predictions(log_id, mqtt_sent)
 
-    def get_baseline(self, base_line_count: int) -> Optional[Any]:
+    def get_baseline(self, base_line_count: int) -> Optional[np.ndarray]:
         """Get baseline data for calibration.
         
+        The rows are packed once into a contiguous float32 array, ready to be
+        passed to the inference engine as is, alongside the latest sample from
+        get_last_log_and_sensor_Values.
+        
         Args:
             base_line_count: Number of samples to include in baseline
             
         Returns:
-            Optional[Any]: Baseline data or None if insufficient data
+            Optional[np.ndarray]: Sensor values with shape (1, N, 32), or None
+            if insufficient data
         """
         if self.get_nb_of_telemetry_log() < base_line_count:
             return None
@@ -420,16 +451,21 @@ class Database:
         with self._Session() as session:
             try:
                 telemetry_values = self.get_telemetry(session, base_line_count, 'ASC')
-                return telemetry_values
+                # Drop the log ID column, keep the 32 sensor channels
+                return np.array([row[1:] for row in telemetry_values], dtype=np.float32)[np.newaxis]
             except Exception as e:
                 session.rollback()
                 raise e
 
-    def get_last_log_and_sensor_Values(self) -> Tuple[Optional[int], Optional[Any]]:
+    def get_last_log_and_sensor_Values(self) -> Tuple[Optional[int], Optional[np.ndarray]]:
         """Get the most recent log entry and sensor values.
         
+        The sample is packed like get_baseline, ready to be passed to the
+        inference engine alongside the baseline.
+        
         Returns:
-            Tuple[Optional[int], Optional[Any]]: Tuple of (log_id, sensor_values)
+            Tuple[Optional[int], Optional[np.ndarray]]: Log ID and sensor values
+            with shape (1, 1, 32), or (None, None) if nothing is logged yet
         """
         with self._Session() as session:
             try:
@@ -437,7 +473,8 @@ class Database:
                 if telemetry_values == []:
                     return None, None
                 telemetry_log = telemetry_values[0][0]
-                return telemetry_log, telemetry_values
+                # Drop the log ID column, keep the 32 sensor channels
+                return telemetry_log, np.array([telemetry_values[0][1:]], dtype=np.float32)[np.newaxis]
             except Exception as e:
                 session.rollback()
                 raise e
@@ -507,6 +544,70 @@ class Database:
                 session.rollback()
                 raise e
 
+    def get_unsent_mqtt_payloads(self, limit: int = 256) -> List[Tuple[int, List[Any]]]:
+        """Get the oldest logs that haven't been sent via MQTT, with their values.
+        
+        All logs and their telemetry values are fetched with a single query.
+        
+        Args:
+            limit: Maximum number of logs to return
+            
+        Returns:
+            List[Tuple[int, List[Any]]]: (log_id, payload) pairs, oldest first. Each
+                payload has the same layout as a sensor sample: the telemetry values
+                ordered by type, then the BFU device ID and the creation timestamp.
+        """
+        with self._Session() as session:
+            try:
+                log_ids = session.query(TelemetryLog.id).filter(
+                    TelemetryLog.sent_mqtt_payload == False
+                ).order_by(TelemetryLog.id).limit(limit).subquery()
+                rows = session.query(
+                    TelemetryLog.id,
+                    TelemetryLog.bfu_device_id,
+                    TelemetryLog.created_at,
+                    Telemetry.value
+                ).join(
+                    Telemetry,
+                    Telemetry.telemetry_log_id == TelemetryLog.id
+                ).filter(
+                    TelemetryLog.id.in_(select(log_ids.c.id))
+                ).order_by(
+                    TelemetryLog.id,
+                    Telemetry.telemetry_type_id
+                ).all()
+            except Exception as e:
+                session.rollback()
+                raise e
+
+        payloads: Dict[int, List[Any]] = {}
+        meta: Dict[int, Tuple[str, str]] = {}
+        for log_id, bfu_device_id, created_at, value in rows:
+            payloads.setdefault(log_id, []).append(value)
+            meta[log_id] = (bfu_device_id, created_at)
+        return [(log_id, values + list(meta[log_id])) for log_id, values in payloads.items()]
+
+    def bulk_mark_sent(self, log_ids: List[int]) -> None:
+        """Mark several telemetry logs as sent via MQTT with one UPDATE.
+        
+        Args:
+            log_ids: IDs of the telemetry logs to mark
+        """
+        if not log_ids:
+            return
+
+        with self._Session() as session:
+            try:
+                session.execute(
+                    update(TelemetryLog).where(
+                        TelemetryLog.id.in_(log_ids)
+                    ).values(sent_mqtt_payload=True)
+                )
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise e
+
     def get_nb_of_telemetry_log(self) -> int:
         """Get the total number of telemetry logs.
         
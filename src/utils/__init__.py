@@ -7,6 +7,7 @@ import json
 import logging
 import multiprocessing
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
@@ -16,9 +17,26 @@ from envs import env
 load_dotenv()
 
 
+@lru_cache(maxsize=8)
+def _read_config(config_file: str) -> Dict[str, Any]:
+    """Read and parse a config file once per process.
+    
+    Args:
+        config_file (str): Path to the JSON config file.
+        
+    Returns:
+        Dict[str, Any]: The parsed configuration.
+    """
+    with open(config_file, 'r') as reader:
+        return json.load(reader)
+
+
 def load_config(key: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from the config file.
     
+    The file is parsed on first use and cached per path, so the returned
+    dictionaries are shared and must not be modified.
+    
     Args:
         key (Optional[str]): Specific configuration key to load. If None,
             returns the entire configuration.
@@ -27,11 +45,9 @@ def load_config(key: Optional[str] = None) -> Dict[str, Any]:
         Dict[str, Any]: The configuration dictionary or the value for the
             specified key.
     """
-    config_file = env('CONFIG_FILE', var_type='string')
-    with open(config_file, 'r') as reader:
-        config = json.load(reader)
-        if key:
-            config = config[key]
+    config = _read_config(env('CONFIG_FILE', var_type='string'))
+    if key:
+        config = config[key]
     return config
 
 
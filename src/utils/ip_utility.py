@@ -1,7 +1,13 @@
 """Utility module for IP address operations."""
 
 import socket
-from typing import Optional
+import time
+from typing import Optional, Tuple
+
+IP_CACHE_TTL = 60.0
+
+# (monotonic time of the lookup, address)
+_cached_ip: Optional[Tuple[float, str]] = None
 
 
 class IPUtility:
@@ -9,7 +15,7 @@ class IPUtility:
     
     This class provides methods to get the local IP address of the machine.
     It uses a UDP socket to determine the IP address, falling back to localhost
-    if the operation fails.
+    if the operation fails. The address is cached for IP_CACHE_TTL seconds.
     """
     
     @staticmethod
@@ -25,11 +31,18 @@ class IPUtility:
             interface address. This is a common technique to get the local IP
             without relying on hostname resolution.
         """
+        global _cached_ip
+        now = time.monotonic()
+        if _cached_ip is not None and now - _cached_ip[0] < IP_CACHE_TTL:
+            return _cached_ip[1]
+
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
             sock.settimeout(0)
             try:
                 # doesn't even have to be reachable
                 sock.connect(('10.254.254.254', 1))
-                return sock.getsockname()[0]
+                ip = sock.getsockname()[0]
             except Exception:
-                return '127.0.0.1'
\ No newline at end of file
+                return '127.0.0.1'  # Not cached, the network may come up shortly
+        _cached_ip = (now, ip)
+        return ip
\ No newline at end of file
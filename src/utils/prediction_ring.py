@@ -0,0 +1,108 @@
+"""Shared-memory ring buffer for handing predictions to the IoT process."""
+
+import math
+import multiprocessing
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+# Dates are stored as whole microseconds since this naive epoch, so they come
+# back exactly equal to the datetime that was put in
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class PredictionRing:
+    """Single-producer, single-consumer ring of prediction records.
+
+    Records live in a shared byte array as fixed-size structs holding the log
+    ID, the prediction time and one value per analyte (NaN when an analyte
+    has no result). The producer only ever advances the head and the consumer
+    only ever advances the tail. The indices are read and published under a
+    shared lock, whose acquire and release order the record stores against
+    the index stores on weakly ordered CPUs; the records themselves are
+    copied outside the lock.
+
+    The ring is only a fast path: predictions are still persisted by the
+    producer, and anything that does not fit in the ring is picked up from
+    the database later.
+
+    Attributes:
+        _analytes (Tuple[str, ...]): Analyte names, in record order
+        _record (struct.Struct): Layout of one record
+        _capacity (int): Number of records the ring holds
+        _buffer: Shared record storage
+        _head: Shared count of records written
+        _tail: Shared count of records read
+        _lock: Guards reads and writes of _head and _tail
+    """
+
+    def __init__(self, analytes: List[str], capacity: int = 64) -> None:
+        """Initialize the ring.
+
+        Must be created before the producer and consumer processes start.
+
+        Args:
+            analytes (List[str]): Names of the analytes a prediction can hold
+            capacity (int): Number of records the ring holds
+        """
+        self._analytes = tuple(analytes)
+        self._record = struct.Struct(f'<qq{len(self._analytes)}d')
+        self._capacity = capacity
+        self._buffer = multiprocessing.Array('c', capacity * self._record.size, lock=False)
+        self._head = multiprocessing.Value('Q', 0, lock=False)
+        self._tail = multiprocessing.Value('Q', 0, lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def put(self, log_id: int, results: Dict[str, float], date: datetime) -> bool:
+        """Append a prediction. Producer side only.
+
+        Args:
+            log_id (int): ID of the telemetry log the prediction was made on
+            results (Dict[str, float]): Predicted value per analyte
+            date (datetime): Time of the prediction
+
+        Returns:
+            bool: True if the record was written, False if the ring is full
+        """
+        with self._lock:
+            head, tail = self._head.value, self._tail.value
+        if head - tail >= self._capacity:
+            return False
+        values = [results.get(analyte, math.nan) for analyte in self._analytes]
+        self._record.pack_into(
+            self._buffer, (head % self._capacity) * self._record.size,
+            log_id, (date - _EPOCH) // _MICROSECOND, *values
+        )
+        # Publish the record only once it is fully written
+        with self._lock:
+            self._head.value = head + 1
+        return True
+
+    def drain(self) -> List[Tuple[int, datetime, Dict[str, float]]]:
+        """Take every record written so far. Consumer side only.
+
+        Returns:
+            List[Tuple[int, datetime, Dict[str, float]]]: Log ID, prediction
+            time and predicted values of each record, oldest first
+        """
+        records = []
+        with self._lock:
+            tail, head = self._tail.value, self._head.value
+        if tail == head:
+            return records
+        while tail < head:
+            log_id, microseconds, *values = self._record.unpack_from(
+                self._buffer, (tail % self._capacity) * self._record.size
+            )
+            results = {
+                analyte: value
+                for analyte, value in zip(self._analytes, values)
+                if not math.isnan(value)
+            }
+            records.append((log_id, _EPOCH + microseconds * _MICROSECOND, results))
+            tail += 1
+        # Free the slots only once they have been copied out
+        with self._lock:
+            self._tail.value = tail
+        return records
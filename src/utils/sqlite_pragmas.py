@@ -0,0 +1,35 @@
+"""SQLite connection setup shared by the telemetry and MI databases."""
+
+from typing import Any, Callable
+
+# Pragmas applied to every new SQLite connection. WAL lets one process write
+# while the others read, without any lock of our own. busy_timeout replaces
+# the sqlite3 connect timeout and covers every statement on the connection.
+SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+    'cache_size=-65536',
+    'busy_timeout=15000',
+)
+
+
+def sqlite_pragma_listener(*extra_pragmas: str) -> Callable[[Any, Any], None]:
+    """Build a 'connect' event listener that applies the pragmas.
+
+    The pragmas are sent as one script, so a new connection costs a single
+    call into sqlite3.
+
+    Args:
+        *extra_pragmas: Database-specific pragmas, applied before SQLITE_PRAGMAS
+
+    Returns:
+        Callable[[Any, Any], None]: Listener for sqlalchemy.event.listen(engine, 'connect', ...)
+    """
+    script = ''.join(f'PRAGMA {pragma};' for pragma in (*extra_pragmas, *SQLITE_PRAGMAS))
+
+    def _set_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.executescript(script)
+
+    return _set_sqlite_pragmas